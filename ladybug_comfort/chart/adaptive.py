@@ -124,7 +124,8 @@ class AdaptiveChart(object):
         '_use_ip', '_tp_category', '_to_category', '_prevail_range', '_op_range',
         '_x_range', '_y_range', '_time_multiplier',
         '_time_matrix', '_hour_values', '_remove_pattern', '_container',
-        '_chart_border', '_data_points', '_colored_mesh'
+        '_chart_border', '_neutral_polyline', '_comfort_polygon',
+        '_data_points', '_colored_mesh'
     )
     TEMP_TYPE = Temperature()
     DT_TYPE = TemperatureDelta()
@@ -239,6 +240,8 @@ class AdaptiveChart(object):
 
         # set null values for properties that are optional
         self._chart_border = None
+        self._neutral_polyline = None
+        self._comfort_polygon = None
         self._data_points = None
         self._colored_mesh = None
 
@@ -406,148 +409,16 @@ class AdaptiveChart(object):
     def neutral_polyline(self):
         """Get a LineSegment2D or Polyline2D noting the neutral temperature on the chart.
         """
-        # get properties that are used to compute the neutral temperature
-        tp_c_min, tp_c_max = self._prevail_range[0], self._prevail_range[-1]
-        pl_pts = []
-        if self.comfort_parameter.conditioning != 0:
-            neutral_func = neutral_temperature_conditioned_function(
-                self.comfort_parameter.conditioning, self.comfort_parameter.standard
-            )
-        elif self.comfort_parameter.ashrae_or_en:
-            neutral_func = neutral_temperature_ashrae55
-        else:
-            neutral_func =neutral_temperature_en15251
-
-        # get the beginning points
-        x_val1 = self._x_range[0]
-        if tp_c_min < 10:
-            n_temp = neutral_func(10)
-            y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-            pl_pts.append(Point2D(x_val1, y_val))
-            x_val2 = self.tp_x_value(50) if self.use_ip else self.tp_x_value(10)
-            pl_pts.append(Point2D(x_val2, y_val))
-        else:
-            n_temp = neutral_func(tp_c_min)
-            y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-            pl_pts.append(Point2D(x_val1, y_val))
-        # get the ending points
-        x_val_end = self._x_range[-1]
-        if self.comfort_parameter.ashrae_or_en:
-            if tp_c_max > 33.5:
-                n_temp = neutral_func(33.5)
-                y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-                x_vali = self.tp_x_value(92.3) if self.use_ip else self.tp_x_value(33.5)
-                pl_pts.append(Point2D(x_vali, y_val))
-                pl_pts.append(Point2D(x_val_end, y_val))
-            else:
-                n_temp = neutral_func(tp_c_max)
-                y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-                pl_pts.append(Point2D(x_val_end, y_val))
-        else:
-            if tp_c_max > 30:
-                n_temp = neutral_func(30)
-                y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-                x_vali = self.tp_x_value(86) if self.use_ip else self.tp_x_value(30)
-                pl_pts.append(Point2D(x_vali, y_val))
-                pl_pts.append(Point2D(x_val_end, y_val))
-            else:
-                n_temp = neutral_func(tp_c_max)
-                y_val = self.to_y_value(n_temp) if not self.use_ip else \
-                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
-                pl_pts.append(Point2D(x_val_end, y_val))
-
-        # return the neutral line
-        return Polyline2D(pl_pts) if len(pl_pts) > 2 else \
-            LineSegment2D.from_end_points(pl_pts[0], pl_pts[1])
+        if self._neutral_polyline is None:
+            self._neutral_polyline = self._compute_neutral_polyline()
+        return self._neutral_polyline
 
     @property
     def comfort_polygon(self):
         """Get a Polygon2D for the comfort range on the chart."""
-        # start off with the neutral polyline and move it based on the offset
-        neutral_line = self.neutral_polyline
-        offset_t_up = self.comfort_parameter.neutral_offset
-        # lower threshold of EN-16798 is 1 degree cooler than upper threshold
-        offset_t_low = -self.comfort_parameter.neutral_offset \
-            if self.comfort_parameter.standard == 'ASHRAE-55' else \
-            -self.comfort_parameter.neutral_offset - 1
-        offset_t_up = offset_t_up if not self.use_ip else \
-            self.DT_TYPE.to_unit([offset_t_up], 'dF', 'dC')[0]
-        offset_t_low = offset_t_low if not self.use_ip else \
-            self.DT_TYPE.to_unit([offset_t_low], 'dF', 'dC')[0]
-
-        offset_dist_up = self.y_dim * offset_t_up
-        offset_dist_low = self.y_dim * offset_t_low
-        upper_line = neutral_line.move(Vector2D(0, offset_dist_up))
-        lower_line = neutral_line.move(Vector2D(0, offset_dist_low))
-
-        # trim the bottom of the polygon if there is a cold_prevail_temp_limit
-        if self.comfort_parameter.cold_prevail_temp_limit > 10:
-            limit_tc = self.comfort_parameter.cold_prevail_temp_limit
-            limit_t = limit_tc if not self.use_ip else \
-                self.TEMP_TYPE.to_unit([limit_tc], 'F', 'C')[0]
-            limit_x = self.tp_x_value(limit_t)
-            int_lin = LineSegment2D.from_end_points(Point2D(limit_x, self._y_range[0]),
-                                                    Point2D(limit_x, self._y_range[-1]))
-            i_pts = lower_line.intersect_line_ray(int_lin)
-            if i_pts is not None and (len(i_pts) == 1 or isinstance(i_pts, Point2D)):
-                int_pt = i_pts if isinstance(i_pts, Point2D) else i_pts[0]
-                new_low_pts, int_passed = [], False
-                for pt in lower_line.vertices:
-                    if pt.x < int_pt.x:
-                        new_low_pts.append(Point2D(pt.x, int_pt.y))
-                    elif not int_passed:
-                        new_low_pts.append(int_pt)
-                        new_low_pts.append(pt)
-                        int_passed = True
-                    else:
-                        new_low_pts.append(pt)
-                lower_line = Polyline2D(new_low_pts) if len(new_low_pts) > 2 else \
-                    LineSegment2D.from_end_points(new_low_pts[0], new_low_pts[1])
-
-        # determine if there is a cooling effect
-        if self.comfort_parameter.discrete_or_continuous_air_speed is True:
-            cooling_func = cooling_effect_ashrae55
-        else:
-            cooling_func = cooling_effect_en15251
-        ce = cooling_func(self.air_speed, self._prevail_range[-1])
-        if ce == 0:  # we can build the polygon from upper/lower lines
-            return Polygon2D(lower_line.vertices + tuple(reversed(upper_line.vertices)))
-
-        # adjust the upper line to account for the cooling effect
-        ce_t = ce if not self.use_ip else self.DT_TYPE.to_unit([ce], 'dF', 'dC')[0]
-        ce_dist = self.y_dim * ce_t
-        ce_vec = Vector2D(0, ce_dist)
-        switch_tc = 12 if self.comfort_parameter.ashrae_or_en else 12.73
-        switch_t = switch_tc if not self.use_ip else \
-            self.TEMP_TYPE.to_unit([switch_tc], 'F', 'C')[0]
-        switch_x = self.tp_x_value(switch_t)
-        if upper_line.vertices[0].x >= switch_x:
-            new_up_pts = [pt.move(ce_vec) for pt in upper_line.vertices]
-        else:
-            new_up_pts, switch_occurred = [], False
-            for i, pt in enumerate(upper_line.vertices):
-                if pt.x <= switch_x:
-                    new_up_pts.append(pt)
-                else:
-                    if switch_occurred:
-                        new_up_pts.append(pt.move(ce_vec))
-                    else:
-                        int_line1 = LineSegment2D.from_end_points(
-                            Point2D(switch_x, self._y_range[0]),
-                            Point2D(switch_x, self._y_range[-1]))
-                        int_line2 = LineSegment2D.from_end_points(
-                            upper_line.vertices[i - 1], pt)
-                        int_pt = int_line1.intersect_line_ray(int_line2)
-                        new_up_pts.append(int_pt)
-                        new_up_pts.append(int_pt.move(ce_vec))
-                        new_up_pts.append(pt.move(ce_vec))
-                        switch_occurred = True
-        return Polygon2D(lower_line.vertices + tuple(reversed(new_up_pts)))
+        if self._comfort_polygon is None:
+            self._comfort_polygon = self._compute_comfort_polygon()
+        return self._comfort_polygon
 
     @property
     def neutral_temperature(self):
@@ -595,17 +466,17 @@ class AdaptiveChart(object):
     @property
     def percent_neutral(self):
         """The percent of time that the thermal_condition is neutral."""
-        self._collection.percent_neutral
+        return self._collection.percent_neutral
 
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        self._collection.percent_cold
+        return self._collection.percent_cold
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        self._collection.percent_hot
+        return self._collection.percent_hot
 
     @property
     def title_text(self):
@@ -857,6 +728,150 @@ class AdaptiveChart(object):
             (bpt, Point2D(x_max, bpt.y), Point2D(x_max, y_max), Point2D(bpt.x, y_max))
         )
 
+    def _compute_neutral_polyline(self):
+        """Compute a LineSegment2D or Polyline2D for the neutral temperature."""
+        # get properties that are used to compute the neutral temperature
+        tp_c_min, tp_c_max = self._prevail_range[0], self._prevail_range[-1]
+        pl_pts = []
+        if self.comfort_parameter.conditioning != 0:
+            neutral_func = neutral_temperature_conditioned_function(
+                self.comfort_parameter.conditioning, self.comfort_parameter.standard
+            )
+        elif self.comfort_parameter.ashrae_or_en:
+            neutral_func = neutral_temperature_ashrae55
+        else:
+            neutral_func = neutral_temperature_en15251
+
+        # get the beginning points
+        x_val1 = self._x_range[0]
+        if tp_c_min < 10:
+            n_temp = neutral_func(10)
+            y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+            pl_pts.append(Point2D(x_val1, y_val))
+            x_val2 = self.tp_x_value(50) if self.use_ip else self.tp_x_value(10)
+            pl_pts.append(Point2D(x_val2, y_val))
+        else:
+            n_temp = neutral_func(tp_c_min)
+            y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+            pl_pts.append(Point2D(x_val1, y_val))
+        # get the ending points
+        x_val_end = self._x_range[-1]
+        if self.comfort_parameter.ashrae_or_en:
+            if tp_c_max > 33.5:
+                n_temp = neutral_func(33.5)
+                y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+                x_vali = self.tp_x_value(92.3) if self.use_ip else self.tp_x_value(33.5)
+                pl_pts.append(Point2D(x_vali, y_val))
+                pl_pts.append(Point2D(x_val_end, y_val))
+            else:
+                n_temp = neutral_func(tp_c_max)
+                y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+                pl_pts.append(Point2D(x_val_end, y_val))
+        else:
+            if tp_c_max > 30:
+                n_temp = neutral_func(30)
+                y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+                x_vali = self.tp_x_value(86) if self.use_ip else self.tp_x_value(30)
+                pl_pts.append(Point2D(x_vali, y_val))
+                pl_pts.append(Point2D(x_val_end, y_val))
+            else:
+                n_temp = neutral_func(tp_c_max)
+                y_val = self.to_y_value(n_temp) if not self.use_ip else \
+                    self.to_y_value(self.TEMP_TYPE.to_unit([n_temp], 'F', 'C')[0])
+                pl_pts.append(Point2D(x_val_end, y_val))
+
+        # return the neutral line
+        return Polyline2D(pl_pts) if len(pl_pts) > 2 else \
+            LineSegment2D.from_end_points(pl_pts[0], pl_pts[1])
+
+    def _compute_comfort_polygon(self):
+        """Compute a Polygon2D for the comfort range on the chart."""
+        # start off with the neutral polyline and move it based on the offset
+        neutral_line = self.neutral_polyline
+        offset_t_up = self.comfort_parameter.neutral_offset
+        # lower threshold of EN-16798 is 1 degree cooler than upper threshold
+        offset_t_low = -self.comfort_parameter.neutral_offset \
+            if self.comfort_parameter.standard == 'ASHRAE-55' else \
+            -self.comfort_parameter.neutral_offset - 1
+        offset_t_up = offset_t_up if not self.use_ip else \
+            self.DT_TYPE.to_unit([offset_t_up], 'dF', 'dC')[0]
+        offset_t_low = offset_t_low if not self.use_ip else \
+            self.DT_TYPE.to_unit([offset_t_low], 'dF', 'dC')[0]
+
+        offset_dist_up = self.y_dim * offset_t_up
+        offset_dist_low = self.y_dim * offset_t_low
+        upper_line = neutral_line.move(Vector2D(0, offset_dist_up))
+        lower_line = neutral_line.move(Vector2D(0, offset_dist_low))
+
+        # trim the bottom of the polygon if there is a cold_prevail_temp_limit
+        if self.comfort_parameter.cold_prevail_temp_limit > 10:
+            limit_tc = self.comfort_parameter.cold_prevail_temp_limit
+            limit_t = limit_tc if not self.use_ip else \
+                self.TEMP_TYPE.to_unit([limit_tc], 'F', 'C')[0]
+            limit_x = self.tp_x_value(limit_t)
+            int_lin = LineSegment2D.from_end_points(Point2D(limit_x, self._y_range[0]),
+                                                    Point2D(limit_x, self._y_range[-1]))
+            i_pts = lower_line.intersect_line_ray(int_lin)
+            if i_pts is not None and (len(i_pts) == 1 or isinstance(i_pts, Point2D)):
+                int_pt = i_pts if isinstance(i_pts, Point2D) else i_pts[0]
+                new_low_pts, int_passed = [], False
+                for pt in lower_line.vertices:
+                    if pt.x < int_pt.x:
+                        new_low_pts.append(Point2D(pt.x, int_pt.y))
+                    elif not int_passed:
+                        new_low_pts.append(int_pt)
+                        new_low_pts.append(pt)
+                        int_passed = True
+                    else:
+                        new_low_pts.append(pt)
+                lower_line = Polyline2D(new_low_pts) if len(new_low_pts) > 2 else \
+                    LineSegment2D.from_end_points(new_low_pts[0], new_low_pts[1])
+
+        # determine if there is a cooling effect
+        if self.comfort_parameter.discrete_or_continuous_air_speed is True:
+            cooling_func = cooling_effect_ashrae55
+        else:
+            cooling_func = cooling_effect_en15251
+        ce = cooling_func(self.air_speed, self._prevail_range[-1])
+        if ce == 0:  # we can build the polygon from upper/lower lines
+            return Polygon2D(lower_line.vertices + tuple(reversed(upper_line.vertices)))
+
+        # adjust the upper line to account for the cooling effect
+        ce_t = ce if not self.use_ip else self.DT_TYPE.to_unit([ce], 'dF', 'dC')[0]
+        ce_dist = self.y_dim * ce_t
+        ce_vec = Vector2D(0, ce_dist)
+        switch_tc = 12 if self.comfort_parameter.ashrae_or_en else 12.73
+        switch_t = switch_tc if not self.use_ip else \
+            self.TEMP_TYPE.to_unit([switch_tc], 'F', 'C')[0]
+        switch_x = self.tp_x_value(switch_t)
+        if upper_line.vertices[0].x >= switch_x:
+            new_up_pts = [pt.move(ce_vec) for pt in upper_line.vertices]
+        else:
+            new_up_pts, switch_occurred = [], False
+            for i, pt in enumerate(upper_line.vertices):
+                if pt.x <= switch_x:
+                    new_up_pts.append(pt)
+                else:
+                    if switch_occurred:
+                        new_up_pts.append(pt.move(ce_vec))
+                    else:
+                        int_line1 = LineSegment2D.from_end_points(
+                            Point2D(switch_x, self._y_range[0]),
+                            Point2D(switch_x, self._y_range[-1]))
+                        int_line2 = LineSegment2D.from_end_points(
+                            upper_line.vertices[i - 1], pt)
+                        int_pt = int_line1.intersect_line_ray(int_line2)
+                        new_up_pts.append(int_pt)
+                        new_up_pts.append(int_pt.move(ce_vec))
+                        new_up_pts.append(pt.move(ce_vec))
+                        switch_occurred = True
+        return Polygon2D(lower_line.vertices + tuple(reversed(new_up_pts)))
+
     def _process_legend_default(self, l_par):
         """Override the dimensions of the legend to ensure it fits the chart."""
         min_pt, max_pt = self.container.min_point, self.container.max_point
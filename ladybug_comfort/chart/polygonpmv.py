@@ -679,13 +679,43 @@ class PolygonPMV(object):
             These can be passed to the create_collection method on this class to
             get a data collection for the time inside the polygon.
         """
-        joined_poly = self._lines_to_polygon(polygon, tolerance)  # get a joined polygon
-        # create a list of all points in the polygon
-        value_list = []
+        return self.evaluate_polygons([polygon], tolerance)[0]
+
+    def evaluate_polygons(self, polygons, tolerance=0.01):
+        """Evaluate several strategy polygons in relation to the chart data points.
+
+        This is faster than calling evaluate_polygon once for each polygon since
+        the data points of the chart are only looped over once and the bounding
+        rectangle of each polygon is computed only once.
+
+        Args:
+            polygons: A list of polygons where each polygon is a tuple of Polyline2D
+                and LineSegment2D that form a closed polygon on the psychrometric chart.
+            tolerance: The minimum difference between vertices below which vertices
+                are considered the same. (Default: 0.01).
+
+        Returns:
+            A list with one list of 0 and 1 values for each input polygon, which
+            denotes whether data points lie inside the polygon.
+        """
+        # get joined polygons and their bounding rectangles
+        joined_polys, bounds = [], []
+        for polygon in polygons:
+            joined_poly = self._lines_to_polygon(polygon, tolerance)
+            p_min, p_max = joined_poly.min, joined_poly.max
+            joined_polys.append(joined_poly)
+            bounds.append((p_min.x, p_min.y, p_max.x, p_max.y))
+        # create a list of all points in each of the polygons
+        value_lists = [[] for _ in joined_polys]
         for point in self._psychrometric_chart.data_points:
-            val = 1 if joined_poly.is_point_inside_bound_rect(point) else 0
-            value_list.append(val)
-        return value_list
+            x, y = point.x, point.y
+            for joined_poly, bnd, value_list in zip(joined_polys, bounds, value_lists):
+                if x < bnd[0] or y < bnd[1] or x > bnd[2] or y > bnd[3]:
+                    value_list.append(0)
+                else:
+                    val = 1 if joined_poly.is_point_inside(point) else 0
+                    value_list.append(val)
+        return value_lists
 
     def evaluate_night_flush_polygon(self, polygon, outdoor_temperature,
                                      night_below_comfort=3.0, time_constant=8,
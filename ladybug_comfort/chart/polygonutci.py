@@ -562,5 +562,5 @@ class PolygonUTCI(object):
         return self.__repr__()
 
     def __repr__(self):
-        """PolygonPMV representation."""
-        return "Polygon PMV: ({} Polygons)".format(self._polygon_count)
+        """PolygonUTCI representation."""
+        return "Polygon UTCI: ({} Polygons)".format(self._polygon_count)
@@ -113,6 +113,8 @@ def pmv_mtx(
         if rad_delta_mtx is not None and not os.path.getsize(rad_delta_mtx) == 0:
             d_rad_temp = load_matrix(rad_delta_mtx)
             rad_temp = rad_temp + d_rad_temp
+        # use Python floats since NumPy scalars are slow in the PMV model
+        air_temp, rad_temp, rel_h = air_temp.tolist(), rad_temp.tolist(), rel_h.tolist()
         mtx_len = len(air_temp[0])
 
         # process any of the other inputs for air speed
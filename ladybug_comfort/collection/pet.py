@@ -205,8 +205,8 @@ class PET(ComfortCollection):
         # get wind input
         if include_wind is True:
             wind_speed = epw.wind_speed.duplicate()
-            for i, spd in enumerate(wind_speed):
-                wind_speed[i] = spd * (2 / 3)  # 2/3 is the conversion used by UTCI
+            # 2/3 is the conversion used by UTCI
+            wind_speed.values = [spd * (2 / 3) for spd in wind_speed.values]
         else:
             wind_speed = 0.1
 
@@ -230,14 +230,15 @@ class PET(ComfortCollection):
     def _calculate_pet(self):
         """Compute PET for each step of the Data Collection."""
         self._setup_list_attributes()
+        b_par = self._body_par  # body parameters are the same for every step
+        age, sex, ht, m_body, pos = \
+            b_par.age, b_par.sex, b_par.height, b_par.body_mass, b_par.posture
         for ta, tr, vel, rh, met, clo, pr in \
             zip(self._air_temperature, self._rad_temperature,
                 self._air_speed, self._rel_humidity,
                 self._met_rate, self._clo_value, self._barometric_pressure):
             result = physiologic_equivalent_temperature(
-                ta, tr, vel, rh, met, clo, self._body_par.age, self._body_par.sex,
-                self._body_par.height, self._body_par.body_mass,
-                self._body_par.posture, pr)
+                ta, tr, vel, rh, met, clo, age, sex, ht, m_body, pos, pr)
             self._append_results_to_lists(result)
             self._assess_comfort(result)
 
@@ -441,17 +442,14 @@ class PET(ComfortCollection):
     @property
     def percent_neutral(self):
         """The percent of time that the thermal_condition is neutral."""
-        _vals = [1 for x in self._thermal_condition if x == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(0) / self._calc_length) * 100
 
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        _vals = [1 for x in self._thermal_condition if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(-1) / self._calc_length) * 100
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        _vals = [1 for x in self._thermal_condition if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(1) / self._calc_length) * 100
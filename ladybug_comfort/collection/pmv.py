@@ -236,8 +236,8 @@ class _PMVnoSET(ComfortCollection):
         # get wind input
         if include_wind is True:
             wind_speed = epw.wind_speed.duplicate()
-            for i, spd in enumerate(wind_speed):
-                wind_speed[i] = spd * (2 / 3)  # 2/3 is the conversion used by UTCI
+            # 2/3 is the conversion used by UTCI
+            wind_speed.values = [spd * (2 / 3) for spd in wind_speed.values]
         else:
             wind_speed = 0.1
 
@@ -272,13 +272,19 @@ class _PMVnoSET(ComfortCollection):
 
         # perform the PMV calculation
         self._setup_list_attributes()
+        still_air = self._comfort_par.still_air_threshold
+        computed = {}  # results of inputs that have already been computed
         for ta, tr, vel, rh, met, clo, wme, i in \
             zip(self._air_temperature, self._rad_temperature,
                 self._air_speed, self._rel_humidity,
                 self._met_rate, self._clo_value,
                 self._external_work, range(self._calc_length)):
-            result = predicted_mean_vote_no_set(ta, tr, vel, rh, met, clo, wme,
-                                                self._comfort_par.still_air_threshold)
+            inputs = (ta, tr, vel, rh, met, clo, wme)
+            result = computed.get(inputs)
+            if result is None:
+                result = predicted_mean_vote_no_set(
+                    ta, tr, vel, rh, met, clo, wme, still_air)
+                computed[inputs] = result
             self._append_results_to_lists(result)
             self._assess_comfort(result, i)
 
@@ -478,32 +484,27 @@ class _PMVnoSET(ComfortCollection):
     @property
     def percent_neutral(self):
         """The percent of time that the thermal_condition is neutral."""
-        _vals = [1 for x in self._thermal_condition if x == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(0) / self._calc_length) * 100
 
     @property
     def percent_cold(self):
         """The percent of time that the thermal_condition is cold."""
-        _vals = [1 for x in self._thermal_condition if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(-1) / self._calc_length) * 100
 
     @property
     def percent_hot(self):
         """The percent of time that the thermal_condition is hot."""
-        _vals = [1 for x in self._thermal_condition if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_condition.count(1) / self._calc_length) * 100
 
     @property
     def percent_dry(self):
         """The percent of time that the thermal_condition neutral but it is too dry."""
-        _vals = [1 for x in self._discomfort_reason if x == -2]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._discomfort_reason.count(-2) / self._calc_length) * 100
 
     @property
     def percent_humid(self):
         """The percent of time that the thermal_condition neutral but it is too humid."""
-        _vals = [1 for x in self._discomfort_reason if x == 2]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._discomfort_reason.count(2) / self._calc_length) * 100
 
     @property
     def humidity_ratio(self):
@@ -641,13 +642,18 @@ class PMV(_PMVnoSET):
         # perform the PMV calculation
         self._setup_list_attributes()
         self._set = []
+        still_air = self._comfort_par.still_air_threshold
+        computed = {}  # results of inputs that have already been computed
         for ta, tr, vel, rh, met, clo, wme, i in \
             zip(self._air_temperature, self._rad_temperature,
                 self._air_speed, self._rel_humidity,
                 self._met_rate, self._clo_value,
                 self._external_work, range(self._calc_length)):
-            result = predicted_mean_vote(ta, tr, vel, rh, met, clo, wme,
-                                         self._comfort_par.still_air_threshold)
+            inputs = (ta, tr, vel, rh, met, clo, wme)
+            result = computed.get(inputs)
+            if result is None:
+                result = predicted_mean_vote(ta, tr, vel, rh, met, clo, wme, still_air)
+                computed[inputs] = result
             self._append_results_to_lists(result)
             self._set.append(result['set'])
             self._assess_comfort(result, i)
@@ -521,15 +521,23 @@ class HorizontalSolarCal(_SolarCalBase):
         # get altitudes and sharps from solar position
         _altitudes, _sharps = self._get_altitudes_and_sharps()
 
+        # get the body parameters once since they do not change over the period
+        posture = self._body_par.posture
+        body_abs = self._body_par.body_absorptivity
+        body_emiss = self._body_par.body_emissivity
+
         # calculate final erfs and mrt deltas
         for l_mrt, diff, dir, alt, sharp, fract_e, flr_ref, in \
                 zip(self._l_mrt, self._diff_horiz, self._dir_horiz, _altitudes, _sharps,
                     self._fract_exp, self._flr_ref):
-
+            if alt < 2:  # sun is too low to produce a shortwave MRT delta
+                self._erf.append(0)
+                self._dmrt.append(0)
+                self._mrt.append(l_mrt)
+                continue
             result = shortwave_from_horiz_solar(l_mrt, diff, dir, alt, fract_e,
-                                                flr_ref, self._body_par.posture,
-                                                sharp, self._body_par.body_absorptivity,
-                                                self._body_par.body_emissivity)
+                                                flr_ref, posture, sharp,
+                                                body_abs, body_emiss)
             self._erf.append(result['erf'])
             self._dmrt.append(result['dmrt'])
             self._mrt.append(result['mrt'])
@@ -640,14 +648,23 @@ class HorizontalRefSolarCal(_SolarCalBase):
         # get altitudes and sharps from solar position
         _altitudes, _sharps = self._get_altitudes_and_sharps()
 
+        # get the body parameters once since they do not change over the period
+        posture = self._body_par.posture
+        body_abs = self._body_par.body_absorptivity
+        body_emiss = self._body_par.body_emissivity
+
         # calculate final erfs and mrt deltas
         for l_mrt, diff, dir, ref, alt, sharp, fract_e, in \
                 zip(self._l_mrt, self._diff_horiz, self._dir_horiz, self._ref_horiz,
                     _altitudes, _sharps, self._fract_exp):
-
+            if alt < 2:  # sun is too low to produce a shortwave MRT delta
+                self._erf.append(0)
+                self._dmrt.append(0)
+                self._mrt.append(l_mrt)
+                continue
             result = shortwave_from_horiz_components(
-                l_mrt, diff, dir, ref, alt, fract_e, self._body_par.posture,
-                sharp, self._body_par.body_absorptivity, self._body_par.body_emissivity)
+                l_mrt, diff, dir, ref, alt, fract_e, posture,
+                sharp, body_abs, body_emiss)
             self._erf.append(result['erf'])
             self._dmrt.append(result['dmrt'])
             self._mrt.append(result['mrt'])
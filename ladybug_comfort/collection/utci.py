@@ -181,13 +181,13 @@ class UTCI(ComfortCollection):
         """Compute UTCI for each step of the Data Collection."""
         self._utci = []
         self._thermal_category = []
+        eleven_point = self._comfort_par.thermal_condition_eleven_point
         for ta, tr, vel, rh in \
             zip(self._air_temperature, self._rad_temperature,
                 self._wind_speed, self._rel_humidity):
             result = universal_thermal_climate_index(ta, tr, vel, rh)
             self._utci.append(result)
-            self._thermal_category.append(
-                self._comfort_par.thermal_condition_eleven_point(result))
+            self._thermal_category.append(eleven_point(result))
 
     @property
     def air_temperature(self):
@@ -349,8 +349,7 @@ class UTCI(ComfortCollection):
     @property
     def percent_comfortable(self):
         """The percent of time comfortabe given by the assigned comfort_parameter."""
-        _vals = [1 for t in self._thermal_category if t == 0]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(0) / self._calc_length) * 100
 
     @property
     def percent_uncomfortable(self):
@@ -377,62 +376,52 @@ class UTCI(ComfortCollection):
     @property
     def percent_slight_cold_stress(self):
         """The percent of time that conditions have slight cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(-1) / self._calc_length) * 100
 
     @property
     def percent_moderate_cold_stress(self):
         """The percent of time that conditions have moderate cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -2]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(-2) / self._calc_length) * 100
 
     @property
     def percent_strong_cold_stress(self):
         """The percent of time that conditions have strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -3]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(-3) / self._calc_length) * 100
 
     @property
     def percent_very_strong_cold_stress(self):
         """The percent of time that conditions have very strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -4]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(-4) / self._calc_length) * 100
 
     @property
     def percent_extreme_cold_stress(self):
         """The percent of time that conditions have very strong cold stress."""
-        _vals = [1 for x in self._thermal_category if x == -5]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(-5) / self._calc_length) * 100
 
     @property
     def percent_slight_heat_stress(self):
         """The percent of time that conditions have slight heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 1]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(1) / self._calc_length) * 100
 
     @property
     def percent_moderate_heat_stress(self):
         """The percent of time that conditions have moderate heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 2]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(2) / self._calc_length) * 100
 
     @property
     def percent_strong_heat_stress(self):
         """The percent of time that conditions have strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 3]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(3) / self._calc_length) * 100
 
     @property
     def percent_very_strong_heat_stress(self):
         """The percent of time that conditions have very strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 4]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(4) / self._calc_length) * 100
 
     @property
     def percent_extreme_heat_stress(self):
         """The percent of time that conditions have very strong heat stress."""
-        _vals = [1 for x in self._thermal_category if x == 5]
-        return (sum(_vals) / self._calc_length) * 100
+        return (self._thermal_category.count(5) / self._calc_length) * 100
 
     def _comf_val_funct(self):
         return [self._comfort_par.is_comfortable(t) for t in self._utci]
@@ -36,18 +36,19 @@ def heat_index(ta, rh):
     if tf < 80:
         hif = 0.5 * (tf + 61.0 + ((tf - 68.0) * 1.2) + (rh * 0.094))
     else:
+        tf2, rh2 = tf * tf, rh * rh  # squares are used by several terms
         hif = -42.379 + 2.04901523 * tf + \
             10.14333127 * rh - \
             0.22475541 * tf * rh - \
-            6.83783e-3 * tf ** 2 - \
-            5.481717e-2 * rh ** 2 + \
-            1.22874e-3 * tf ** 2 * rh + \
-            8.5282e-4 * tf * rh ** 2 - \
-            1.99e-6 * tf ** 2 * rh ** 2
-        if tf >= 80 and tf <= 112 and rh < 13:
+            6.83783e-3 * tf2 - \
+            5.481717e-2 * rh2 + \
+            1.22874e-3 * tf2 * rh + \
+            8.5282e-4 * tf * rh2 - \
+            1.99e-6 * tf2 * rh2
+        if tf <= 112 and rh < 13:
             adjust = ((13. - rh) / 4.) * math.sqrt((17. - abs(tf - 95.)) / 17.)
             hif = hif - adjust
-        elif tf >= 80 and tf <= 87 and rh > 85:
+        elif tf <= 87 and rh > 85:
             adjust = ((rh - 85) / 10) * ((87 - tf) / 5)
             hif = hif + adjust
 
@@ -69,23 +69,22 @@ def _parse_enclosure_info(enclosure_info, result_sql, epw, analysis_period=None,
     with open(enclosure_info) as json_file:
         enclosure_dict = json.load(json_file)
 
+    # index the sql data by zone so that each zone is found with a single lookup
+    air_temp_dict = _data_by_metadata(air_temps, 'Zone')
+    rad_temp_dict = _data_by_metadata(rad_temps, 'Zone')
+    if include_humidity:
+        humid_dict = _data_by_metadata(humids, 'System')
+
     # order the sql data based on the relevant zones from the enclosure_info
     rel_air_temps, rel_rad_temps, rel_humids, rel_speeds = [], [], [], []
     for zone_id in enclosure_dict['mapper']:
         zone_id = zone_id.upper()  # capitalize to match the output of EnergyPlus
-        for data in air_temps:
-            if data.header.metadata['Zone'] == zone_id:
-                rel_air_temps.append(data)
-                break
-        for data in rad_temps:
-            if data.header.metadata['Zone'] == zone_id:
-                rel_rad_temps.append(data)
-                break
-        if include_humidity:
-            for data in humids:
-                if data.header.metadata['System'] == zone_id:
-                    rel_humids.append(data)
-                    break
+        if zone_id in air_temp_dict:
+            rel_air_temps.append(air_temp_dict[zone_id])
+        if zone_id in rad_temp_dict:
+            rel_rad_temps.append(rad_temp_dict[zone_id])
+        if include_humidity and zone_id in humid_dict:
+            rel_humids.append(humid_dict[zone_id])
         rel_speeds.append(default_air_speed)
 
     # if the enclosure info includes outdoor sensors, ensure epw data is added
@@ -118,6 +117,21 @@ def _parse_enclosure_info(enclosure_info, result_sql, epw, analysis_period=None,
     return pt_air_temps, pt_rad_temps, pt_humids, pt_speeds, base_a_per
 
 
+def _data_by_metadata(data_colls, key):
+    """Get a dictionary of data collections keyed by a value in their metadata.
+
+    If several data collections share the same metadata value, the first one is used.
+
+    Args:
+        data_colls: A list of data collections.
+        key: Text for the metadata key to be used for the dictionary (eg. Zone).
+    """
+    data_dict = {}
+    for data in data_colls:
+        data_dict.setdefault(data.header.metadata[key], data)
+    return data_dict
+
+
 def _values_to_data(values, base_period, data_type, data_units):
     """Load an array of values to a data collection.
 
@@ -263,7 +263,8 @@ def _ill_file_to_data(ill_file, sun_indices, timestep=1, leap_yr=False):
     """Convert a list of sun-up irradiance from an .ill file into annual irradiance data.
 
     Args:
-        ill_file: Path to an .ill file.
+        ill_file: Path to an .ill file. This can be a text file, a binary Radiance
+            file or a NumPy .npy file of the same matrix.
         sun_indices: A list of integers for where in the total_count sun-up hours occur.
         timestep: The timestep to make the data collection.
         leap_yr: Boolean to note if data is for a leap year.
@@ -286,10 +287,13 @@ def _ill_file_to_data(ill_file, sun_indices, timestep=1, leap_yr=False):
                     ill_values, sun_indices, header, timestep, leap_yr)
                 irr_data.append(pt_irr_data)
     else:
-        results = binary_to_array(ill_file)
+        # NumPy files are memory-mapped so that only one row is read at a time
+        results = np.load(ill_file, mmap_mode='r') if first_char == b'\x93' \
+            else binary_to_array(ill_file)
         for ill_values in results:
+            # convert to Python floats since NumPy scalars are slow in SolarCal
             pt_irr_data = _ill_values_to_data(
-                ill_values, sun_indices, header, timestep, leap_yr)
+                ill_values.tolist(), sun_indices, header, timestep, leap_yr)
             irr_data.append(pt_irr_data)
     return irr_data
 
@@ -154,11 +154,13 @@ def physiologic_equivalent_temperature(
     ti = -40  # start of the search interval
     tf = 60  # end of the search interval
     pet = 0
+    f_ti = f(ti)  # only re-evaluated when the start of the interval moves
     while tf - ti > epsilon:  # bisection loop
-        if f(ti) * f(pet) < 0:
+        f_pet = f(pet)
+        if f_ti * f_pet < 0:
             tf = pet
         else:
-            ti = pet
+            ti, f_ti = pet, f_pet
         pet = (ti + tf) / 2
 
     # put all of the results into a single dictionary
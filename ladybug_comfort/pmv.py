@@ -384,6 +384,12 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
     top = (chr * tr + chc * ta) / ctc
     tcl = top + (temp_skin - top) / (ctc * (ra + rcl))
 
+    # evaporative resistances do not change over the iterations
+    rea = 1.0 / (LR * facl * chc)  # evaporative resistance of air layer
+    recl = rcl / (LR * icl)  # evaporative resistance of clothing (icl=.45)
+    exp = math.exp
+    svp = saturated_vapor_pressure_torr
+
     # ========================  BEGIN ITERATION
     #
     # Tcl and chr are solved iteratively using: H(Tsk - To) = ctc(Tcl - To),
@@ -416,26 +422,23 @@ def pierce_set(ta, tr, vel, rh, met, clo, wme=0.):
         temp_core = temp_core + dtcr
         TB = alfa * temp_skin + (1 - alfa) * temp_core
         sksig = temp_skin - temp_skin_neutral
-        warms = (sksig > 0) * sksig
-        colds = ((-1.0 * sksig) > 0) * (-1.0 * sksig)
-        crsig = (temp_core - temp_core_neutral)
-        warmc = (crsig > 0) * crsig
-        coldc = ((-1.0 * crsig) > 0) * (-1.0 * crsig)
+        warms = sksig if sksig > 0 else 0.0
+        colds = -sksig if sksig < 0 else 0.0
+        crsig = temp_core - temp_core_neutral
+        warmc = crsig if crsig > 0 else 0.0
+        coldc = -crsig if crsig < 0 else 0.0
         bdsig = TB - temp_body_neutral
-        warmb = (bdsig > 0) * bdsig
+        warmb = bdsig if bdsig > 0 else 0.0
         skin_blood_flow = (skin_blood_flow_neutral + cdil * warmc) / (1 + cstr * colds)
         if skin_blood_flow > 90.0:
             skin_blood_flow = 90.0
         if skin_blood_flow < 0.5:
             skin_blood_flow = 0.5
-        regsw = csw * warmb * math.exp(warms / 10.7)
+        regsw = csw * warmb * exp(warms / 10.7)
         if regsw > 500.0:
             regsw = 500.0
         ersw = 0.68 * regsw
-        rea = 1.0 / (LR * facl * chc)  # evaporative resistance of air layer
-        recl = rcl / (LR * icl)  # evaporative resistance of clothing (icl=.45)
-        emax = (saturated_vapor_pressure_torr(
-            temp_skin) - vapor_pressure) / (rea + recl)
+        emax = (svp(temp_skin) - vapor_pressure) / (rea + recl)
         prsw = ersw / emax
         pwet = 0.06 + 0.94 * prsw
         edif = pwet * emax - ersw
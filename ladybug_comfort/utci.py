@@ -72,12 +72,12 @@ def saturated_vapor_pressure_hpa(db_temp):
 
     This equation of saturation vapor pressure is specific to the UTCI model.
     """
-    g = (-2836.5744, -6028.076559, 19.54263612, -0.02737830188, 0.000016261698,
-         7.0229056e-10, -1.8680009e-13)
     tk = db_temp + 273.15  # air temp in K
-    es = 2.7150305 * math.log(tk)
-    for i, x in enumerate(g):
-        es = es + (x * (tk**(i - 2)))
+    # terms are written out in the same order as the original loop over the powers
+    # of tk (-2 to 4) so the result is identical but without the per-term overhead
+    es = 2.7150305 * math.log(tk) - 2836.5744 * tk ** -2 - 6028.076559 * tk ** -1 + \
+        19.54263612 - 0.02737830188 * tk + 0.000016261698 * tk ** 2 + \
+        7.0229056e-10 * tk ** 3 - 1.8680009e-13 * tk ** 4
     es = math.exp(es) * 0.01
     return es
 
@@ -177,26 +177,26 @@ def _utci_polynomial(ta, d_tr, vel, pa_pr):
         pa_pr: Vapour pressure [kPa].
     """
     # pre-calculate powers so we can re-use them
-    ta2 = ta ** 2
-    ta3 = ta ** 3
-    ta4 = ta ** 4
-    ta5 = ta ** 5
-    ta6 = ta ** 6
-    vel2 = vel ** 2
-    vel3 = vel ** 3
-    vel4 = vel ** 4
-    vel5 = vel ** 5
-    vel6 = vel ** 6
-    d_tr2 = d_tr ** 2
-    d_tr3 = d_tr ** 3
-    d_tr4 = d_tr ** 4
-    d_tr5 = d_tr ** 5
-    d_tr6 = d_tr ** 6
-    pa_pr2 = pa_pr ** 2
-    pa_pr3 = pa_pr ** 3
-    pa_pr4 = pa_pr ** 4
-    pa_pr5 = pa_pr ** 5
-    pa_pr6 = pa_pr ** 6
+    ta2 = ta * ta
+    ta3 = ta2 * ta
+    ta4 = ta3 * ta
+    ta5 = ta4 * ta
+    ta6 = ta5 * ta
+    vel2 = vel * vel
+    vel3 = vel2 * vel
+    vel4 = vel3 * vel
+    vel5 = vel4 * vel
+    vel6 = vel5 * vel
+    d_tr2 = d_tr * d_tr
+    d_tr3 = d_tr2 * d_tr
+    d_tr4 = d_tr3 * d_tr
+    d_tr5 = d_tr4 * d_tr
+    d_tr6 = d_tr5 * d_tr
+    pa_pr2 = pa_pr * pa_pr
+    pa_pr3 = pa_pr2 * pa_pr
+    pa_pr4 = pa_pr3 * pa_pr
+    pa_pr5 = pa_pr4 * pa_pr
+    pa_pr6 = pa_pr5 * pa_pr
 
     # UTCI approximation calculation
     utci_approx = ta + \
@@ -13,10 +13,9 @@ def test_actual_sensation_vote():
                                                                   rel=1e-3)
 
 
-def test_actual_sensation_vote_effect_category():
+@pytest.mark.parametrize('asv,category', [
+    (2.5, 2), (1.4, 1), (0.5, 0), (-1.4, -1), (-2.5, -2)
+])
+def test_actual_sensation_vote_effect_category(asv, category):
     """Test the actual_sensation_vote_effect_category function"""
-    assert actual_sensation_vote_effect_category(2.5) == 2
-    assert actual_sensation_vote_effect_category(1.4) == 1
-    assert actual_sensation_vote_effect_category(0.5) == 0
-    assert actual_sensation_vote_effect_category(-1.4) == -1
-    assert actual_sensation_vote_effect_category(-2.5) == -2
+    assert actual_sensation_vote_effect_category(asv) == category
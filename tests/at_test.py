@@ -9,14 +9,11 @@ def test_apparent_temperature():
     assert apparent_temperature(32, 85, 10) == pytest.approx(34.290083, rel=1e-3)
     assert apparent_temperature(20, 50, 15) == pytest.approx(9.3482423, rel=1e-3)
 
-    assert apparent_temperature_warning_category(60) == 4
-    assert apparent_temperature_warning_category(40) == 3
-    assert apparent_temperature_warning_category(35) == 2
-    assert apparent_temperature_warning_category(26) == 1
-    assert apparent_temperature_warning_category(25) == 0
-    assert apparent_temperature_warning_category(16) == -1
-    assert apparent_temperature_warning_category(11) == -2
-    assert apparent_temperature_warning_category(6) == -3
-    assert apparent_temperature_warning_category(5) == -4
-    assert apparent_temperature_warning_category(0) == -5
-    assert apparent_temperature_warning_category(-5) == -6
+
+@pytest.mark.parametrize('at,category', [
+    (60, 4), (40, 3), (35, 2), (26, 1), (25, 0), (16, -1),
+    (11, -2), (6, -3), (5, -4), (0, -5), (-5, -6)
+])
+def test_apparent_temperature_warning_category(at, category):
+    """Test the apparent_temperature_warning_category function."""
+    assert apparent_temperature_warning_category(at) == category
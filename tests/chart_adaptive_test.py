@@ -1,29 +1,28 @@
+import pytest
+
 from ladybug_geometry.geometry2d import Point2D, LineSegment2D, Polyline2D, \
     Polygon2D, Mesh2D
 
 from ladybug.legend import Legend, LegendParameters
 from ladybug.graphic import GraphicContainer
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.epw import EPW
-from ladybug.sql import SQLiteResult
 
 from ladybug_comfort.parameter.adaptive import AdaptiveParameter
 from ladybug_comfort.chart.adaptive import AdaptiveChart
 
 
-def test_adaptive_chart_init():
-    """Test the initialization of AdaptiveChart and basic properties."""
-    path = './tests/epw/boston.epw'
-    input_sql = './tests/sql/eplusout.sql'
-    epw_obj = EPW(path)
-    sql_obj = SQLiteResult(input_sql)
-    op_temps = sql_obj.data_collections_by_output_name('Zone Operative Temperature')
+def _all_same_type(seq, obj_type):
+    """Check that a sequence is not empty and all items are exactly of obj_type."""
+    return len(seq) > 0 and set(map(type, seq)) == {obj_type}
+
 
+def test_adaptive_chart_init(boston_epw, op_temps):
+    """Test the initialization of AdaptiveChart and basic properties."""
     adapt_chart = AdaptiveChart(
-        epw_obj.dry_bulb_temperature, op_temps[0], 1.2,
+        boston_epw.dry_bulb_temperature, op_temps[0], 1.2,
         AdaptiveParameter(avg_month_or_running_mean=False, cold_prevail_temp_limit=15))
 
-    str(adapt_chart)  # test the string representation
+    assert str(adapt_chart) == 'Adaptive Chart: 8760 values'
     assert isinstance(adapt_chart.prevailing_outdoor_temperature, HourlyContinuousCollection)
     assert isinstance(adapt_chart.operative_temperature, HourlyContinuousCollection)
     assert isinstance(adapt_chart.legend_parameters, LegendParameters)
@@ -40,34 +39,43 @@ def test_adaptive_chart_init():
     assert isinstance(mesh, Mesh2D)
     assert len(mesh.faces) > 1
     data_points = adapt_chart.data_points
-    assert all(isinstance(pt, Point2D) for pt in data_points)
+    assert _all_same_type(data_points, Point2D)
     hour_values = adapt_chart.hour_values
-    assert all(isinstance(pt, (float, int)) for pt in hour_values)
+    assert set(map(type, hour_values)) <= {float, int}
     time_matrix = adapt_chart.time_matrix
-    assert all(isinstance(pt, tuple) for pt in time_matrix)
+    assert _all_same_type(time_matrix, tuple)
 
     border = adapt_chart.chart_border
     assert isinstance(border, Polygon2D)
     assert len(border.segments) == 4
-    assert isinstance(adapt_chart.neutral_polyline, (LineSegment2D, Polyline2D))
-    assert isinstance(adapt_chart.comfort_polygon, Polygon2D)
-    assert len(adapt_chart.comfort_polygon) == 7
+    neutral_line = adapt_chart.neutral_polyline
+    assert isinstance(neutral_line, (LineSegment2D, Polyline2D))
+    assert adapt_chart.neutral_polyline is neutral_line
+    comfort_polygon = adapt_chart.comfort_polygon
+    assert isinstance(comfort_polygon, Polygon2D)
+    assert len(comfort_polygon) == 7
+    assert adapt_chart.comfort_polygon is comfort_polygon
+
+    assert 0 < adapt_chart.percent_comfortable < 100
+    assert adapt_chart.percent_neutral == adapt_chart.percent_comfortable
+    assert adapt_chart.percent_hot + adapt_chart.percent_cold == \
+        pytest.approx(adapt_chart.percent_uncomfortable, rel=1e-3)
 
     temp_txt = adapt_chart.prevailing_labels
-    assert all(isinstance(txt, str) for txt in temp_txt)
+    assert _all_same_type(temp_txt, str)
     temp_lines = adapt_chart.prevailing_lines
     temp_pts = adapt_chart.prevailing_label_points
     assert len(temp_lines) == len(temp_txt) == len(temp_pts)
-    assert all(isinstance(line, LineSegment2D) for line in temp_lines)
-    assert all(isinstance(pt, Point2D) for pt in temp_pts)
+    assert _all_same_type(temp_lines, LineSegment2D)
+    assert _all_same_type(temp_pts, Point2D)
 
     operative_txt = adapt_chart.operative_labels
-    assert all(isinstance(txt, str) for txt in operative_txt)
+    assert _all_same_type(operative_txt, str)
     operative_lines = adapt_chart.operative_lines
     operative_pts = adapt_chart.operative_label_points
     assert len(operative_txt) == len(operative_pts)
-    assert all(isinstance(line, LineSegment2D) for line in operative_lines)
-    assert all(isinstance(pt, Point2D) for pt in operative_pts)
+    assert _all_same_type(operative_lines, LineSegment2D)
+    assert _all_same_type(operative_pts, Point2D)
 
     assert isinstance(adapt_chart.legend, Legend)
     assert isinstance(adapt_chart.container, GraphicContainer)
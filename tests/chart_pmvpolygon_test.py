@@ -1,21 +1,20 @@
+import pytest
 
 from ladybug_comfort.chart.polygonpmv import PolygonPMV
 from ladybug_comfort.parameter.pmv import PMVParameter
 
-from ladybug.epw import EPW
 from ladybug.psychchart import PsychrometricChart
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug_geometry.geometry2d.line import LineSegment2D
 from ladybug_geometry.geometry2d.polyline import Polyline2D
 
 
-def test_polygonpmv_init():
+def test_polygonpmv_init(chicago_epw_path):
     """Test the initialization of PolygonPMV and basic properties."""
-    path = './tests/epw/chicago.epw'
-    psych_chart = PsychrometricChart.from_epw(path)
+    psych_chart = PsychrometricChart.from_epw(chicago_epw_path)
     poly_obj = PolygonPMV(psych_chart, clo_value=[0.5, 1.0])
 
-    str(poly_obj)  # test the sting representation
+    assert str(poly_obj) == 'Polygon PMV: (2 Polygons)'
 
     assert poly_obj.psychrometric_chart is psych_chart
     assert poly_obj.rad_temperature == (None, None)
@@ -28,9 +27,9 @@ def test_polygonpmv_init():
     assert poly_obj.comfort_parameter.humid_ratio_lower == 0
     assert poly_obj.polygon_count == 2
     assert len(poly_obj.left_comfort_lines) == 2
-    assert all(isinstance(pline, Polyline2D) for pline in poly_obj.left_comfort_lines)
+    assert set(map(type, poly_obj.left_comfort_lines)) == {Polyline2D}
     assert len(poly_obj.right_comfort_lines) == 2
-    assert all(isinstance(pline, Polyline2D) for pline in poly_obj.right_comfort_lines)
+    assert set(map(type, poly_obj.right_comfort_lines)) == {Polyline2D}
     assert isinstance(poly_obj.left_comfort_line, Polyline2D)
     assert isinstance(poly_obj.right_comfort_line, Polyline2D)
     assert len(poly_obj.comfort_polygons) == 2
@@ -40,60 +39,53 @@ def test_polygonpmv_init():
     assert isinstance(poly_obj.merged_comfort_polygon[2], Polyline2D)
     assert isinstance(poly_obj.merged_comfort_polygon[3], Polyline2D)
     assert len(poly_obj.comfort_values) == 2
-    assert all(isinstance(dat, HourlyContinuousCollection)
-               for dat in poly_obj.comfort_data)
+    assert set(map(type, poly_obj.comfort_data)) == {HourlyContinuousCollection}
     assert len(poly_obj.merged_comfort_values) == 8760
+    assert set(poly_obj.merged_comfort_values) == {0, 1}
     assert isinstance(poly_obj.merged_comfort_data, HourlyContinuousCollection)
     assert not poly_obj.is_comfort_too_hot
     assert not poly_obj.is_comfort_too_cold
 
 
-def test_evaporative_cooling_polygon():
-    """Test the evaporative_cooling_polygon method."""
-    # test the polygon with the default comfort settings
-    psych_chart = PsychrometricChart(20, 50)
-    poly_obj = PolygonPMV(psych_chart)
-    evap_poly = poly_obj.evaporative_cooling_polygon()
-    val_list = poly_obj.evaluate_polygon(evap_poly)
-    assert val_list == [0]
+CUSTOM_PAR = {'humid_ratio_upper': 0.008, 'humid_ratio_lower': 0.005}
 
-    # test the polygon with custom comfort settings
-    psych_chart = PsychrometricChart(35, 10)
-    pmv_par = PMVParameter(humid_ratio_upper=0.008, humid_ratio_lower=0.005)
-    poly_obj = PolygonPMV(psych_chart, comfort_parameter=pmv_par)
-    evap_poly = poly_obj.evaporative_cooling_polygon()
-    val_list = poly_obj.evaluate_polygon(evap_poly)
-    assert val_list == [1]
 
+@pytest.mark.parametrize(
+    'temperature,rel_humid,method_name,method_args,comfort_par,expected', [
+        (20, 50, 'evaporative_cooling_polygon', (), {}, 0),
+        (35, 10, 'evaporative_cooling_polygon', (), CUSTOM_PAR, 1),
+        (20, 50, 'fan_use_polygon', (), {}, 0),
+        (30, 30, 'fan_use_polygon', (1.5,), CUSTOM_PAR, 1),
+        (25, 50, 'internal_heat_polygon', (), {}, 0),
+        (15, 50, 'internal_heat_polygon', (), CUSTOM_PAR, 1)
+    ])
+def test_strategy_polygon(temperature, rel_humid, method_name, method_args,
+                          comfort_par, expected):
+    """Test the evaporative_cooling, fan_use and internal_heat polygon methods."""
+    psych_chart = PsychrometricChart(temperature, rel_humid)
+    pmv_par = PMVParameter(**comfort_par)
+    poly_obj = PolygonPMV(psych_chart, comfort_parameter=pmv_par)
+    strategy_poly = getattr(poly_obj, method_name)(*method_args)
+    val_list = poly_obj.evaluate_polygon(strategy_poly)
+    assert val_list == [expected]
 
-def test_fan_use_polygon():
-    """Test the fan_use_polygon method."""
-    # test the polygon with the default comfort settings
-    psych_chart = PsychrometricChart(20, 50)
-    poly_obj = PolygonPMV(psych_chart)
-    fan_poly = poly_obj.fan_use_polygon()
-    val_list = poly_obj.evaluate_polygon(fan_poly)
-    assert val_list == [0]
 
-    # test the polygon with custom comfort settings
-    psych_chart = PsychrometricChart(30, 30)
-    pmv_par = PMVParameter(humid_ratio_upper=0.008, humid_ratio_lower=0.005)
-    poly_obj = PolygonPMV(psych_chart, comfort_parameter=pmv_par)
-    fan_poly = poly_obj.fan_use_polygon(1.5)
-    val_list = poly_obj.evaluate_polygon(fan_poly)
-    assert val_list == [1]
+@pytest.fixture(scope='module')
+def chicago_polygon_pmv(chicago_epw):
+    """PolygonPMV with default settings for the Chicago EPW, built once per module."""
+    epw = chicago_epw
+    psych_chart = PsychrometricChart(epw.dry_bulb_temperature, epw.relative_humidity)
+    return epw, PolygonPMV(psych_chart)
 
 
-def test_night_flush_polygon():
+def test_night_flush_polygon(chicago_polygon_pmv):
     """Test the night_flush_polygon method."""
     # test the polygon with the default comfort settings
-    path = './tests/epw/chicago.epw'
-    epw = EPW(path)
-    psych_chart = PsychrometricChart(epw.dry_bulb_temperature, epw.relative_humidity)
-    poly_obj = PolygonPMV(psych_chart)
+    epw, poly_obj = chicago_polygon_pmv
     nf_poly = poly_obj.night_flush_polygon()
     val_list = poly_obj.evaluate_night_flush_polygon(nf_poly, epw.dry_bulb_temperature)
-    assert 0 < sum(val_list) < 8760
+    assert len(val_list) == 8760
+    assert set(val_list) == {0, 1}  # some hours are inside and some outside
 
     # test the polygon with custom comfort settings
     psych_chart = PsychrometricChart(30, 30, max_temperature=40)
@@ -104,36 +96,28 @@ def test_night_flush_polygon():
     assert val_list == [1]
 
 
-def test_internal_heat_polygon():
-    """Test the internal_heat_polygon method."""
-    # test the polygon with the default comfort settings
-    psych_chart = PsychrometricChart(25, 50)
-    poly_obj = PolygonPMV(psych_chart)
-    inht_poly = poly_obj.internal_heat_polygon()
-    val_list = poly_obj.evaluate_polygon(inht_poly)
-    assert val_list == [0]
-
-    # test the polygon with custom comfort settings
-    psych_chart = PsychrometricChart(15, 50)
-    pmv_par = PMVParameter(humid_ratio_upper=0.008, humid_ratio_lower=0.005)
-    poly_obj = PolygonPMV(psych_chart, comfort_parameter=pmv_par)
-    inht_poly = poly_obj.internal_heat_polygon()
-    val_list = poly_obj.evaluate_polygon(inht_poly)
-    assert val_list == [1]
+def test_evaluate_polygons(chicago_polygon_pmv):
+    """Test that evaluate_polygons matches evaluate_polygon for each polygon."""
+    _, poly_obj = chicago_polygon_pmv
+    polys = [poly_obj.evaporative_cooling_polygon(), poly_obj.fan_use_polygon(),
+             poly_obj.internal_heat_polygon()]
+    val_lists = poly_obj.evaluate_polygons(polys)
+    assert len(val_lists) == 3
+    for poly, val_list in zip(polys, val_lists):
+        assert len(val_list) == 8760
+        assert val_list == poly_obj.evaluate_polygon(poly)
 
 
-def test_passive_solar_polygon():
+def test_passive_solar_polygon(chicago_polygon_pmv):
     """Test the passive_solar_polygon method."""
     # test the polygon with the default comfort settings
-    path = './tests/epw/chicago.epw'
-    epw = EPW(path)
-    psych_chart = PsychrometricChart(epw.dry_bulb_temperature, epw.relative_humidity)
-    poly_obj = PolygonPMV(psych_chart)
+    epw, poly_obj = chicago_polygon_pmv
     sol_vals, delta = poly_obj.evaluate_passive_solar(epw.global_horizontal_radiation)
     sol_poly = poly_obj.passive_solar_polygon(delta)
     sol_poly = poly_obj.passive_solar_polygon(delta)
     assert len(sol_poly) == 4
-    assert 0 < sum(sol_vals) < 8760
+    assert len(sol_vals) == 8760
+    assert set(sol_vals) == {0, 1}  # some hours are inside and some outside
 
     # test the polygon with custom comfort settings
     psych_chart = PsychrometricChart(15, 30, max_temperature=40)
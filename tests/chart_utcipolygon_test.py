@@ -1,6 +1,5 @@
 
 from ladybug_comfort.chart.polygonutci import PolygonUTCI
-from ladybug_comfort.parameter.utci import UTCIParameter
 
 from ladybug.psychchart import PsychrometricChart
 from ladybug.datacollection import HourlyContinuousCollection
@@ -8,13 +7,12 @@ from ladybug_geometry.geometry2d.line import LineSegment2D
 from ladybug_geometry.geometry2d.polyline import Polyline2D
 
 
-def test_polygon_utci_init():
+def test_polygon_utci_init(chicago_epw_path):
     """Test the initialization of PolygonUTCI and basic properties."""
-    path = './tests/epw/chicago.epw'
-    psych_chart = PsychrometricChart.from_epw(path)
+    psych_chart = PsychrometricChart.from_epw(chicago_epw_path)
     poly_obj = PolygonUTCI(psych_chart, wind_speed=[1.0, 10.0])
 
-    str(poly_obj)  # test the sting representation
+    assert str(poly_obj) == 'Polygon UTCI: (2 Polygons)'
 
     assert poly_obj.psychrometric_chart is psych_chart
     assert poly_obj.rad_temperature == (None, None)
@@ -23,9 +21,9 @@ def test_polygon_utci_init():
     assert poly_obj.comfort_parameter.heat_thresh == 26
     assert poly_obj.polygon_count == 2
     assert len(poly_obj.left_comfort_lines) == 2
-    assert all(isinstance(pline, Polyline2D) for pline in poly_obj.left_comfort_lines)
+    assert set(map(type, poly_obj.left_comfort_lines)) == {Polyline2D}
     assert len(poly_obj.right_comfort_lines) == 2
-    assert all(isinstance(pline, Polyline2D) for pline in poly_obj.right_comfort_lines)
+    assert set(map(type, poly_obj.right_comfort_lines)) == {Polyline2D}
     assert isinstance(poly_obj.left_comfort_line, Polyline2D)
     assert isinstance(poly_obj.right_comfort_line, Polyline2D)
     assert len(poly_obj.comfort_polygons) == 2
@@ -35,9 +33,9 @@ def test_polygon_utci_init():
     assert isinstance(poly_obj.merged_comfort_polygon[2], Polyline2D)
     assert isinstance(poly_obj.merged_comfort_polygon[3], Polyline2D)
     assert len(poly_obj.comfort_values) == 2
-    assert all(isinstance(dat, HourlyContinuousCollection)
-               for dat in poly_obj.comfort_data)
+    assert set(map(type, poly_obj.comfort_data)) == {HourlyContinuousCollection}
     assert len(poly_obj.merged_comfort_values) == 8760
+    assert set(poly_obj.merged_comfort_values) == {0, 1}
     assert isinstance(poly_obj.merged_comfort_data, HourlyContinuousCollection)
     assert not poly_obj.is_comfort_too_hot
     assert not poly_obj.is_comfort_too_cold
\ No newline at end of file
@@ -1,48 +1,50 @@
 """Test cli epw module."""
 from click.testing import CliRunner
 import json
+import pytest
 
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+from ladybug.datatype.temperature import Temperature
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug_comfort.cli.epw import utci, set_, prevailing, air_speed_json
+from ladybug_comfort.cli.epw import utci, set_, prevailing, air_speed_json, \
+    _write_data_to_file
 
+# global run period used by several of the tests
+day_run_period = '7/6 to 7/6 between 0 and 23 @1'
 
-def test_utci():
-    """Test the epw utci command."""
-    runner = CliRunner()
-    input_epw = './tests/epw/chicago.epw'
 
-    result = runner.invoke(
-        utci, [input_epw, '--exclude-wind', '--exclude-sun', '--csv'])
-    assert result.exit_code == 0
+@pytest.mark.parametrize('command', [utci, set_])
+def test_utci_set(command, chicago_epw_path):
+    """Test the epw utci and set commands."""
+    runner = CliRunner()
+    input_epw = chicago_epw_path
 
     result = runner.invoke(
-        utci, [input_epw, '--exclude-wind', '--exclude-sun', '--json'])
+        command, [input_epw, '--exclude-wind', '--exclude-sun', '--json'])
     assert result.exit_code == 0
     data_dict = json.loads(result.output)
-    utci_data = HourlyContinuousCollection.from_dict(data_dict)
-    assert len(utci_data) == 8760
+    assert len(data_dict['values']) == 8760
 
 
-def test_set():
-    """Test the epw set command."""
+def test_utci_csv(chicago_epw_path):
+    """Test the epw utci command with CSV output."""
     runner = CliRunner()
-    input_epw = './tests/epw/chicago.epw'
+    input_epw = chicago_epw_path
 
     result = runner.invoke(
-        set_, [input_epw, '--exclude-wind', '--exclude-sun', '--json'])
+        utci, [input_epw, '--exclude-wind', '--exclude-sun', '--csv'])
     assert result.exit_code == 0
-    data_dict = json.loads(result.output)
-    set_data = HourlyContinuousCollection.from_dict(data_dict)
-    assert len(set_data) == 8760
+    assert len(result.output.split()) == 8760
 
 
-def test_prevailing():
+def test_prevailing(chicago_epw_path):
     """Test the epw prevailing command."""
     runner = CliRunner()
-    input_epw = './tests/epw/chicago.epw'
+    input_epw = chicago_epw_path
 
     cmds = [input_epw, '--columns']
-    cmds.extend(['--run-period', '7/6 to 7/6 between 0 and 23 @1'])
+    cmds.extend(['--run-period', day_run_period])
 
     result = runner.invoke(prevailing, cmds)
     assert result.exit_code == 0
@@ -50,14 +52,40 @@ def test_prevailing():
     assert len(data_row) == 24
 
 
-def test_air_speed_json():
+def test_air_speed_json(chicago_epw_path):
     """Test the air-speed-json command."""
     runner = CliRunner()
-    input_epw = './tests/epw/chicago.epw'
+    input_epw = chicago_epw_path
     input_enclosure = './tests/map/TestRoom_1_enclosure2.json'
 
     cmds = [input_epw, input_enclosure]
-    cmds.extend(['--run-period', '7/6 to 7/6 between 0 and 23 @1'])
+    cmds.extend(['--run-period', day_run_period])
 
     result = runner.invoke(air_speed_json, cmds)
     assert result.exit_code == 0
+
+
+def test_write_data_to_file(tmp_path):
+    """Test the formatting of data written by the epw commands."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    data = HourlyContinuousCollection(header, list(range(24)))
+    out_path = str(tmp_path / 'data.txt')
+
+    with open(out_path, 'w') as output_file:
+        _write_data_to_file(output_file, data, None, True, True)
+    with open(out_path) as output_file:
+        assert output_file.read().split('\n') == [str(v) for v in data.values]
+
+    with open(out_path, 'w') as output_file:
+        _write_data_to_file(
+            output_file, data, '1/1 to 1/1 between 0 and 11 @1', True, False)
+    with open(out_path) as output_file:
+        assert output_file.read().split(',') == [str(v) for v in data.values[:12]]
+
+    with open(out_path, 'w') as output_file:
+        _write_data_to_file(output_file, data, None, False, True)
+    with open(out_path) as output_file:
+        data_dict = json.load(output_file)
+    assert data_dict == data.to_dict()
+    new_data = HourlyContinuousCollection.from_dict(data_dict)
+    assert new_data.values == data.values
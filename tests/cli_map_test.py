@@ -3,7 +3,6 @@ from click.testing import CliRunner
 import json
 import os
 
-from ladybug.futil import nukedir
 from ladybug.header import Header
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.datatype.temperature import OperativeTemperature, \
@@ -27,33 +26,33 @@ sun_up_path = './tests/map/results/total/sun-up-hours.txt'
 total_ill_path = './tests/map/results/total/TestRoom_1.ill'
 direct_ill_path = './tests/map/results/direct/TestRoom_1.ill'
 ref_ill_path = './tests/map/results/total/TestRoom_1_ref.ill'
+day_run_period = '1/2 to 1/2 between 0 and 23 @1'
+week_run_period = '7/6 to 7/12 between 0 and 23 @1'
+annual_period = AnalysisPeriod()
+op_temp_header = Header(OperativeTemperature(), 'C', annual_period).to_dict()
 
 
-def test_pmv_map():
+def test_pmv_map(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/map/pmv_map_results'
-    run_period = AnalysisPeriod(1, 2, 0, 1, 2, 23)
+    res_folder = str(tmp_path / 'pmv_map_results')
 
     base_cmd = [sql_path, enclosure_path, epw_path]
     base_cmd.extend(['-tr', total_ill_path, '-dr', direct_ill_path, '-rr', ref_ill_path])
     base_cmd.extend(['-sh', sun_up_path])
-    base_cmd.extend(['-rp', str(run_period)])
+    base_cmd.extend(['-rp', day_run_period])
     base_cmd.extend(['--folder', res_folder])
 
     result = runner.invoke(pmv, base_cmd)
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
 
-    nukedir(res_folder, True)
 
-
-def test_adaptive_map():
+def test_adaptive_map(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/map/adaptive_map_results'
+    res_folder = str(tmp_path / 'adaptive_map_results')
 
     base_cmd = [sql_path, enclosure_path, epw_path]
     base_cmd.extend(['-tr', total_ill_path, '-dr', direct_ill_path, '-rr', ref_ill_path])
@@ -64,16 +63,13 @@ def test_adaptive_map():
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
-
-    nukedir(res_folder, True)
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
 
 
-def test_utci_map():
+def test_utci_map(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/map/utci_map_results'
+    res_folder = str(tmp_path / 'utci_map_results')
 
     base_cmd = [sql_path, enclosure_path, epw_path]
     base_cmd.extend(['-tr', total_ill_path, '-dr', direct_ill_path, '-rr', ref_ill_path])
@@ -84,16 +80,13 @@ def test_utci_map():
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
-
-    nukedir(res_folder, True)
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
 
 
-def test_shortwave_mrt_map():
+def test_shortwave_mrt_map(tmp_path):
     runner = CliRunner()
-    res_file = './tests/map/shortwave.csv'
+    res_file = str(tmp_path / 'shortwave.csv')
 
     base_cmd = [epw_path, total_ill_path, direct_ill_path, ref_ill_path, sun_up_path]
     base_cmd.extend(['--output-file', res_file])
@@ -102,50 +95,46 @@ def test_shortwave_mrt_map():
 
     assert result.exit_code == 0
     assert os.path.isfile(res_file)
-    os.remove(res_file)
 
 
-def test_longwave_mrt_map():
+def test_longwave_mrt_map(tmp_path):
     runner = CliRunner()
-    res_file = './tests/map/longwave.csv'
+    res_file = str(tmp_path / 'longwave.csv')
 
     base_cmd = [sql_path2, view_factors_path, modifiers_path, enclosure_path2, epw_path]
-    base_cmd.extend(['--run-period', '7/6 to 7/12 between 0 and 23 @1'])
+    base_cmd.extend(['--run-period', week_run_period])
     base_cmd.extend(['--output-file', res_file])
 
     result = runner.invoke(longwave_mrt, base_cmd)
 
     assert result.exit_code == 0
     assert os.path.isfile(res_file)
-    os.remove(res_file)
 
 
-def test_air_map():
+def test_air_map(tmp_path):
     runner = CliRunner()
-    res_file = './tests/map/air.csv'
+    res_file = str(tmp_path / 'air.csv')
 
     base_cmd = [sql_path2, enclosure_path2, epw_path]
-    base_cmd.extend(['--run-period', '7/6 to 7/12 between 0 and 23 @1'])
+    base_cmd.extend(['--run-period', week_run_period])
     base_cmd.extend(['--output-file', res_file])
 
     result = runner.invoke(air_temperature, base_cmd)
 
     assert result.exit_code == 0
     assert os.path.isfile(res_file)
-    os.remove(res_file)
 
 
 def test_map_result_info():
     runner = CliRunner()
-    a_per = AnalysisPeriod()
+    a_per = annual_period
     a_per_sub = AnalysisPeriod(6, 21, 0, 9, 21, 23)
 
     cmd = ['pmv', '--run-period', '', '--qualifier', 'write-op-map']
     result = runner.invoke(map_result_info, cmd)
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert out_files['temperature'] == \
-        Header(OperativeTemperature(), 'C', a_per).to_dict()
+    assert out_files['temperature'] == op_temp_header
     assert out_files['condition'] == \
         Header(ThermalCondition(), 'condition', a_per).to_dict()
     assert out_files['condition_intensity'] == \
@@ -166,8 +155,7 @@ def test_map_result_info():
     result = runner.invoke(map_result_info, cmd)
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert out_files['temperature'] == \
-        Header(OperativeTemperature(), 'C', a_per).to_dict()
+    assert out_files['temperature'] == op_temp_header
     assert out_files['condition_intensity'] == \
         Header(OperativeTemperatureDelta(), 'dC', a_per).to_dict()
 
@@ -181,11 +169,11 @@ def test_map_result_info():
         Header(ThermalConditionElevenPoint(), 'condition', a_per).to_dict()
 
 
-def test_tcp():
+def test_tcp(tmp_path):
     runner = CliRunner()
     condition_path = './tests/map/map_results/condition.csv'
     occ_sch_path = './tests/map/occ_schedules.json'
-    res_folder = './tests/map/metrics'
+    res_folder = str(tmp_path / 'metrics')
 
     base_cmd = [condition_path, enclosure_path, '--occ-schedule-json', occ_sch_path]
     base_cmd.extend(['--folder', res_folder])
@@ -195,8 +183,8 @@ def test_tcp():
     out_files = json.loads(result.output)
     for fp in out_files:
         assert os.path.isfile(fp)
-    nukedir(res_folder, True)
 
+    res_folder = str(tmp_path / 'metrics_no_schedule')
     cmds = [condition_path, enclosure_path, '--folder', res_folder]
     result = runner.invoke(tcp, cmds)
 
@@ -204,4 +192,3 @@ def test_tcp():
     out_files = json.loads(result.output)
     for fp in out_files:
         assert os.path.isfile(fp)
-    nukedir(res_folder, True)
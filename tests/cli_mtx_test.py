@@ -3,8 +3,6 @@ from click.testing import CliRunner
 import json
 import os
 
-from ladybug.futil import nukedir
-
 from ladybug_comfort.cli.mtx import pmv_mtx, adaptive_mtx, utci_mtx
 
 
@@ -19,9 +17,9 @@ clo_path = './tests/mtx/clo.csv'
 met_path = './tests/mtx/met.csv'
 
 
-def test_pmv_mtx():
+def test_pmv_mtx(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/mtx/pmv_mtx'
+    res_folder = str(tmp_path / 'pmv_mtx')
 
     base_cmd = [air_path, rh_path, '--air-speed-json', air_speed_path,
                 '--clo-value', clo_path, '--met-rate', met_path]
@@ -32,16 +30,13 @@ def test_pmv_mtx():
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
-
-    nukedir(res_folder, True)
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
 
 
-def test_adaptive_mtx():
+def test_adaptive_mtx(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/mtx/adaptive_mtx'
+    res_folder = str(tmp_path / 'adaptive_mtx')
 
     base_cmd = [air_path, prevailing_path, '--air-speed-json', air_speed_path]
     base_cmd.extend(['-rm', long_mrt_path, '-dm', short_mrt_path])
@@ -51,16 +46,13 @@ def test_adaptive_mtx():
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
 
-    nukedir(res_folder, True)
 
-
-def test_utci_mtx():
+def test_utci_mtx(tmp_path):
     runner = CliRunner()
-    res_folder = './tests/mtx/utci_mtx'
+    res_folder = str(tmp_path / 'utci_mtx')
 
     base_cmd = [air_path, rh_path, '--wind-speed-json', air_speed_path]
     base_cmd.extend(['-rm', long_mrt_path, '-dm', short_mrt_path])
@@ -70,8 +62,5 @@ def test_utci_mtx():
 
     assert result.exit_code == 0
     out_files = json.loads(result.output)
-    assert os.path.isfile(out_files['temperature'])
-    assert os.path.isfile(out_files['condition'])
-    assert os.path.isfile(out_files['condition_intensity'])
-
-    nukedir(res_folder, True)
+    for metric in ('temperature', 'condition', 'condition_intensity'):
+        assert os.path.isfile(out_files[metric])
@@ -1,5 +1,6 @@
 """Test cli sql module."""
 from click.testing import CliRunner
+import pytest
 import json
 
 from ladybug.datacollection import HourlyContinuousCollection
@@ -7,6 +8,7 @@ from ladybug_comfort.parameter.adaptive import AdaptiveParameter
 from ladybug_comfort.cli.sql import pmv_by_room, adaptive_by_room
 
 
+@pytest.mark.slow
 def test_pmv_by_room():
     runner = CliRunner()
     input_sql = './tests/sql/eplusout.sql'
@@ -14,9 +16,8 @@ def test_pmv_by_room():
     result = runner.invoke(pmv_by_room, [input_sql])
     assert result.exit_code == 0
     data_dicts = json.loads(result.output)
-    pmv_data = [HourlyContinuousCollection.from_dict(dat) for dat in data_dicts]
-    assert len(pmv_data) == 2
-    assert len(pmv_data[0]) == 8760
+    assert len(data_dicts) == 2
+    assert len(data_dicts[0]['values']) == 8760
 
 
 def test_adaptive_by_room():
@@ -27,9 +28,9 @@ def test_adaptive_by_room():
     result = runner.invoke(adaptive_by_room, [input_sql, input_epw, '-v', '0.65'])
     assert result.exit_code == 0
     data_dicts = json.loads(result.output)
-    ad_data = [HourlyContinuousCollection.from_dict(dat) for dat in data_dicts]
-    assert len(ad_data) == 2
-    assert len(ad_data[0]) == 8760
+    assert len(data_dicts) == 2
+    ad_data = HourlyContinuousCollection.from_dict(data_dicts[0])
+    assert len(ad_data) == 8760
 
 
 def test_adaptive_by_room_custom():
@@ -46,6 +47,5 @@ def test_adaptive_by_room_custom():
         adaptive_by_room, [input_sql, input_epw, '-v', air_speed, '-cp', str(comf_par)])
     assert result.exit_code == 0
     data_dicts = json.loads(result.output)
-    ad_data = [HourlyContinuousCollection.from_dict(dat) for dat in data_dicts]
-    assert len(ad_data) == 2
-    assert len(ad_data[0]) == 8760
+    assert len(data_dicts) == 2
+    assert len(data_dicts[0]['values']) == 8760
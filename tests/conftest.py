@@ -0,0 +1,77 @@
+# coding utf-8
+"""Fixtures shared across the ladybug-comfort test modules."""
+import os
+import pytest
+
+from ladybug.epw import EPW
+from ladybug.wea import Wea
+from ladybug.sql import SQLiteResult
+
+# folder of the test files so the fixtures do not depend on the working directory
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def pytest_addoption(parser):
+    """Add the option to run the tests that are marked as slow."""
+    parser.addoption('--slow', action='store_true', default=False,
+                     help='Run the tests marked as slow (eg. annual SET and PET).')
+
+
+def pytest_configure(config):
+    """Register the slow marker."""
+    config.addinivalue_line('markers', 'slow: test takes several seconds to run.')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the tests marked as slow unless the --slow option is used."""
+    if config.getoption('--slow'):
+        return
+    skip_slow = pytest.mark.skip(reason='use the --slow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope='session')
+def boston_epw():
+    """EPW object for Boston that is parsed only once per test session."""
+    return EPW(os.path.join(TEST_DIR, 'epw', 'boston.epw'))
+
+
+@pytest.fixture(scope='session')
+def chicago_epw_path():
+    """Path to the Chicago EPW file for tests that need the file itself."""
+    return os.path.join(TEST_DIR, 'epw', 'chicago.epw')
+
+
+@pytest.fixture(scope='session')
+def chicago_epw(chicago_epw_path):
+    """EPW object for Chicago that is parsed only once per test session."""
+    return EPW(chicago_epw_path)
+
+
+@pytest.fixture(scope='session')
+def chicago_wea(chicago_epw):
+    """Wea for Chicago built from chicago_epw without parsing the file again."""
+    return Wea.from_annual_values(
+        chicago_epw.location, chicago_epw.direct_normal_radiation.values,
+        chicago_epw.diffuse_horizontal_radiation.values,
+        is_leap_year=chicago_epw.is_leap_year)
+
+
+@pytest.fixture(scope='session')
+def eplusout_sql():
+    """SQLiteResult for the sample EnergyPlus SQL file with two zones."""
+    return SQLiteResult(os.path.join(TEST_DIR, 'sql', 'eplusout.sql'))
+
+
+@pytest.fixture(scope='session')
+def op_temps(eplusout_sql):
+    """Zone Operative Temperature collections queried once from eplusout_sql."""
+    return eplusout_sql.data_collections_by_output_name('Zone Operative Temperature')
+
+
+@pytest.fixture(scope='session')
+def mrt_temps(eplusout_sql):
+    """Zone Mean Radiant Temperature collections queried once from eplusout_sql."""
+    return eplusout_sql.data_collections_by_output_name('Zone Mean Radiant Temperature')
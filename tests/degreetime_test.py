@@ -3,7 +3,6 @@ import pytest
 
 from ladybug_comfort.degreetime import heating_degree_time, cooling_degree_time
 
-from ladybug.epw import EPW
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.datatype.temperaturetime import HeatingDegreeTime, CoolingDegreeTime
 
@@ -19,11 +18,10 @@ def test_heating_degree_time():
     assert heating_degree_time(temperature, base_temp) == 0
 
 
-def test_heating_degree_time_collection():
+def test_heating_degree_time_collection(chicago_epw):
     """Test the heating_degree_time function with Data Collections."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
 
     hourly_heat = HourlyContinuousCollection.compute_function_aligned(
         heating_degree_time, [epw.dry_bulb_temperature, 18],
@@ -46,11 +44,10 @@ def test_cooling_degree_time():
     assert cooling_degree_time(temperature, base_temp) == 0
 
 
-def test_cooling_degree_time_collection():
+def test_cooling_degree_time_collection(chicago_epw):
     """Test the cooling_degree_time function with Data Collections."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
 
     hourly_cool = HourlyContinuousCollection.compute_function_aligned(
         cooling_degree_time, [epw.dry_bulb_temperature, 23],
@@ -3,7 +3,6 @@ import pytest
 
 from ladybug_comfort.hi import heat_index, heat_index_warning_category
 
-from ladybug.epw import EPW
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.thermalcondition import ThermalCondition
@@ -13,6 +12,8 @@ def test_heating_degree_time():
     """Test the heat_index function."""
     assert heat_index(32, 85) == pytest.approx(46.582479, rel=1e-3)
     assert heat_index(20, 50) == pytest.approx(19.3611, rel=1e-3)
+    assert heat_index(30, 5) == pytest.approx(27.49864, rel=1e-3)  # dry adjustment
+    assert heat_index(28, 90) == pytest.approx(34.00320, rel=1e-3)  # humid adjustment
 
     assert heat_index_warning_category(20) == 0
     assert heat_index_warning_category(30) == 1
@@ -21,11 +22,10 @@ def test_heating_degree_time():
     assert heat_index_warning_category(56) == 4
 
 
-def test_heating_degree_time_collection():
+def test_heating_degree_time_collection(chicago_epw):
     """Test the heat_index function with Data Collections."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
 
     hourly_hi = HourlyContinuousCollection.compute_function_aligned(
         heat_index, [epw.dry_bulb_temperature, epw.relative_humidity],
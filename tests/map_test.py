@@ -1,10 +1,12 @@
 # coding utf-8
-from ladybug_comfort.map.mrt import shortwave_mrt_map
+import pytest
+import numpy as np
+
+from ladybug_comfort.map.mrt import shortwave_mrt_map, _ill_file_to_data
+from ladybug_comfort.map.tcp import tcp_total
 from ladybug_comfort.map._enclosure import _parse_enclosure_info
 
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.sql import SQLiteResult
-from ladybug.epw import EPW
 
 
 # global files object used by all of the tests
@@ -14,16 +16,12 @@ direct_ill_path = './tests/map/results/direct/TestRoom_1.ill'
 ref_ill_path = './tests/map/results/total/TestRoom_1_ref.ill'
 enclosure_path = './tests/map/TestRoom_1_enclosure.json'
 sql_path = './tests/sql/eplusout.sql'
-sql = SQLiteResult(sql_path)
-epw_path = './tests/epw/boston.epw'
-epw = EPW(epw_path)
 
 
-def test_shortwave_mrt_map():
+def test_shortwave_mrt_map(boston_epw, mrt_temps):
     """Test the shortwave_mrt_map method."""
-    location = epw.location
-    l_mrt_data = sql.data_collections_by_output_name('Zone Mean Radiant Temperature')
-    l_mrt_data = [l_mrt_data[0]] * 4
+    location = boston_epw.location
+    l_mrt_data = [mrt_temps[0]] * 4
 
     mrt_map_data = shortwave_mrt_map(
         location, l_mrt_data, sun_up_path, total_ill_path, direct_ill_path, ref_ill_path)
@@ -34,10 +32,25 @@ def test_shortwave_mrt_map():
         assert len(mrt_dat) == 8760
 
 
-def test_parse_enclosure_info():
+def test_ill_file_to_data_npy(tmp_path):
+    """Test that _ill_file_to_data reads NumPy files like text .ill files."""
+    with open(sun_up_path) as soh_f:
+        sun_indices = [int(float(h)) for h in soh_f]
+    npy_path = str(tmp_path / 'TestRoom_1.npy')
+    np.save(npy_path, np.loadtxt(total_ill_path))
+
+    txt_data = _ill_file_to_data(total_ill_path, sun_indices)
+    npy_data = _ill_file_to_data(npy_path, sun_indices)
+    assert len(npy_data) == len(txt_data) == 4
+    for txt_dat, npy_dat in zip(txt_data, npy_data):
+        assert npy_dat.values == txt_dat.values
+    assert type(npy_data[0].values[sun_indices[0]]) is float
+
+
+def test_parse_enclosure_info(boston_epw):
     """Test the _parse_enclosure_info method."""
     pt_air_temps, pt_rad_temps, pt_humids, pt_speeds, a_period = _parse_enclosure_info(
-        enclosure_path, sql_path, epw, include_humidity=True)
+        enclosure_path, sql_path, boston_epw, include_humidity=True)
 
     assert len(pt_air_temps) == 4
     for air_dat in pt_air_temps:
@@ -52,3 +65,16 @@ def test_parse_enclosure_info():
         assert isinstance(hum_dat, HourlyContinuousCollection)
         assert len(hum_dat) == 8760
     assert len(pt_speeds) == 4
+
+
+def test_tcp_total():
+    """Test the tcp_total method."""
+    condition_path = './tests/map/map_results/condition.csv'
+    tcp_list, hsp_list, csp_list = tcp_total(condition_path)
+
+    assert len(tcp_list) == len(hsp_list) == len(csp_list) == 4
+    assert tcp_list[0] == pytest.approx(57.83105, rel=1e-3)
+    assert hsp_list[0] == pytest.approx(19.37214, rel=1e-3)
+    assert csp_list[0] == pytest.approx(22.79680, rel=1e-3)
+    for tcp, hsp, csp in zip(tcp_list, hsp_list, csp_list):
+        assert tcp + hsp + csp == pytest.approx(100, rel=1e-3)
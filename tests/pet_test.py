@@ -5,14 +5,18 @@ from ladybug.datatype.temperature import Temperature
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.epw import EPW
 
 from ladybug_comfort.pet import physiologic_equivalent_temperature
 from ladybug_comfort.parameter.pet import PETParameter
 from ladybug_comfort.collection.pet import PET
 
 
-def test_pet():
+@pytest.mark.parametrize('ta,tr,expected', [
+    (-20, 10, {'pet': -16.9, 't_core': 22.8, 't_skin': 4.04, 't_clo': -7.78}),
+    (20, 30, {'pet': 22.3, 't_core': 36.88, 't_skin': 28.8, 't_clo': 24.6}),
+    (30, 60, {'pet': 42.5, 't_core': 39.28, 't_skin': 38.18, 't_clo': 40.29})
+])
+def test_pet(ta, tr, expected):
     """Test the physiologic_equivalent_temperature function"""
     # sample input data for the PET model
     rh = 50  # relative humidity [%]
@@ -20,23 +24,9 @@ def test_pet():
     met = 2.3  # metabolic rate [met]
     clo = 1  # clothing level [clo]
 
-    result = physiologic_equivalent_temperature(-20, 10, vel, rh, met, clo)
-    assert result['pet'] == pytest.approx(-16.9, rel=1e-2)
-    assert result['t_core'] == pytest.approx(22.8, rel=1e-2)
-    assert result['t_skin'] == pytest.approx(4.04, rel=1e-2)
-    assert result['t_clo'] == pytest.approx(-7.78, rel=1e-2)
-
-    result = physiologic_equivalent_temperature(20, 30, vel, rh, met, clo)
-    assert result['pet'] == pytest.approx(22.3, rel=1e-2)
-    assert result['t_core'] == pytest.approx(36.88, rel=1e-2)
-    assert result['t_skin'] == pytest.approx(28.8, rel=1e-2)
-    assert result['t_clo'] == pytest.approx(24.6, rel=1e-2)
-
-    result = physiologic_equivalent_temperature(30, 60, vel, rh, met, clo)
-    assert result['pet'] == pytest.approx(42.5, rel=1e-2)
-    assert result['t_core'] == pytest.approx(39.28, rel=1e-2)
-    assert result['t_skin'] == pytest.approx(38.18, rel=1e-2)
-    assert result['t_clo'] == pytest.approx(40.29, rel=1e-2)
+    result = physiologic_equivalent_temperature(ta, tr, vel, rh, met, clo)
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value, rel=1e-2)
 
 
 def test_pet_parameter():
@@ -224,12 +214,18 @@ def test_pet_collection_comfort_outputs():
     assert pet_obj.core_temperature_category[0] == 0
     assert pet_obj.core_temperature_category[-1] == 2
 
+    # derived data collections are only built on the first request
+    assert pet_obj.is_comfortable is pet_obj.is_comfortable
+    assert pet_obj.thermal_condition is pet_obj.thermal_condition
+    assert pet_obj.pet_category is pet_obj.pet_category
+    assert pet_obj.percent_neutral + pet_obj.percent_cold + pet_obj.percent_hot == \
+        pytest.approx(100, rel=1e-6)
+
 
-def test_pet_collection_comfort_percent_outputs():
+@pytest.mark.slow
+def test_pet_collection_comfort_percent_outputs(chicago_epw):
     """Test the percent outputs of the PET collection."""
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
-    pet_obj = PET(epw.dry_bulb_temperature, epw.relative_humidity,
+    pet_obj = PET(chicago_epw.dry_bulb_temperature, chicago_epw.relative_humidity,
                   met_rate=2.4, clo_value=1)
 
     assert 11 < pet_obj.percent_neutral < 13
@@ -10,7 +10,6 @@ from ladybug_comfort.pmv import predicted_mean_vote, fanger_pmv, \
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.epw import EPW
 
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.fraction import RelativeHumidity
@@ -19,6 +18,24 @@ from ladybug.datatype.energyflux import MetabolicRate
 from ladybug.datatype.rvalue import ClothingInsulation
 
 
+@pytest.fixture(scope='module')
+def day_header():
+    """Temperature header for a single day that is shared by the collection tests."""
+    return Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+
+
+@pytest.fixture
+def air_temp(day_header):
+    """New 24-hour air temperature collection at 24C for each test to edit freely."""
+    return HourlyContinuousCollection(day_header, [24] * 24)
+
+
+@pytest.fixture(scope='module')
+def pmv_default(day_header):
+    """PMV collection at 24C and 50% RH shared by the tests that only read from it."""
+    return PMV(HourlyContinuousCollection(day_header, [24] * 24), 50)
+
+
 def test_fanger_pmv():
     """Test the fanger_pmv function"""
     pmv_comf, ppd, hl = fanger_pmv(19, 23, 0.1, 60, 1.5, 0.4)
@@ -30,7 +47,8 @@ def test_fanger_pmv():
     assert hl['res_s'] == pytest.approx(1.8317, rel=1e-2)
     assert hl['rad'] == pytest.approx(26.63829, rel=1e-2)
     assert hl['conv'] == pytest.approx(44.745778, rel=1e-2)
-    assert sum(hl.values()) == pytest.approx(103.78, rel=1e-2)
+    total = hl['cond'] + hl['sweat'] + hl['res_l'] + hl['res_s'] + hl['rad'] + hl['conv']
+    assert total == pytest.approx(103.78, rel=1e-2)
 
 
 def test_pmv_validation():
@@ -83,41 +101,30 @@ def test_pmv_from_ppd():
     assert pmv_upper == pytest.approx(1, rel=1e-1)
 
 
-def test_calc_missing_pmv_input():
+@pytest.mark.parametrize('pmv_inputs,up_bound,key,expected,rel', [
+    ({'ta': None, 'tr': 20, 'vel': 0.05, 'rh': 50, 'met': 1.2, 'clo': 0.75, 'wme': 0},
+     100, 'ta', 18.529, 1e-1),
+    ({'ta': 20, 'tr': None, 'vel': 0.05, 'rh': 50, 'met': 1.2, 'clo': 0.75, 'wme': 0},
+     100, 'tr', 17.912, 1e-1),
+    ({'ta': 22, 'tr': 22, 'vel': None, 'rh': 50, 'met': 1.2, 'clo': 0.75, 'wme': 0},
+     1, 'vel', 0.6396, 1e-1),
+    ({'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': None, 'met': 1.2, 'clo': 0.75, 'wme': 0},
+     100, 'rh', 7.0, 1e-1),
+    ({'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50, 'met': None, 'clo': 0.75, 'wme': 0},
+     1, 'met', 1.1234, 1e-2),
+    ({'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50, 'met': 1.2, 'clo': None, 'wme': 0},
+     1, 'clo', 0.6546, 1e-2),
+    ({'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50, 'met': 1.4, 'clo': 0.75, 'wme': None},
+     1, 'wme', 0.3577, 1e-2),
+    ({'ta': None, 'tr': None, 'vel': 0.05, 'rh': 50, 'met': 1.2, 'clo': 0.75, 'wme': 0},
+     1, 'ta', 19.13548, 1e-3)
+])
+def test_calc_missing_pmv_input(pmv_inputs, up_bound, key, expected, rel):
     """Test the calc_missing_pmv_input function"""
-    input_1 = {'ta': None, 'tr': 20, 'vel': 0.05, 'rh': 50,
-               'met': 1.2, 'clo': 0.75, 'wme': 0}
-    input_2 = {'ta': 20, 'tr': None, 'vel': 0.05, 'rh': 50,
-               'met': 1.2, 'clo': 0.75, 'wme': 0}
-    input_3 = {'ta': 22, 'tr': 22, 'vel': None, 'rh': 50,
-               'met': 1.2, 'clo': 0.75, 'wme': 0}
-    input_4 = {'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': None,
-               'met': 1.2, 'clo': 0.75, 'wme': 0}
-    input_5 = {'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50,
-               'met': None, 'clo': 0.75, 'wme': 0}
-    input_6 = {'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50,
-               'met': 1.2, 'clo': None, 'wme': 0}
-    input_7 = {'ta': 20, 'tr': 20, 'vel': 0.05, 'rh': 50,
-               'met': 1.4, 'clo': 0.75, 'wme': None}
-    input_8 = {'ta': None, 'tr': None, 'vel': 0.05, 'rh': 50,
-               'met': 1.2, 'clo': 0.75, 'wme': 0}
-    updated_input_1 = calc_missing_pmv_input(-1, input_1)
-    updated_input_2 = calc_missing_pmv_input(-1, input_2)
-    updated_input_3 = calc_missing_pmv_input(-1, input_3, up_bound=1)
-    updated_input_4 = calc_missing_pmv_input(-1, input_4)
-    updated_input_5 = calc_missing_pmv_input(-1, input_5, up_bound=1)
-    updated_input_6 = calc_missing_pmv_input(-1, input_6, up_bound=1)
-    updated_input_7 = calc_missing_pmv_input(-1, input_7, up_bound=1)
-    updated_input_8 = calc_missing_pmv_input(-1, input_8, up_bound=1)
-    assert updated_input_1['ta'] == pytest.approx(18.529, rel=1e-1)
-    assert updated_input_2['tr'] == pytest.approx(17.912, rel=1e-1)
-    assert updated_input_3['vel'] == pytest.approx(0.6396, rel=1e-1)
-    assert updated_input_4['rh'] == pytest.approx(7.0, rel=1e-1)
-    assert updated_input_5['met'] == pytest.approx(1.1234, rel=1e-2)
-    assert updated_input_6['clo'] == pytest.approx(0.6546, rel=1e-2)
-    assert updated_input_7['wme'] == pytest.approx(0.3577, rel=1e-2)
-    assert updated_input_8['ta'] == pytest.approx(19.13548, rel=1e-3)
-    assert updated_input_8['ta'] == updated_input_8['tr']
+    updated_input = calc_missing_pmv_input(-1, pmv_inputs, up_bound=up_bound)
+    assert updated_input[key] == pytest.approx(expected, rel=rel)
+    if pmv_inputs['ta'] is None and pmv_inputs['tr'] is None:
+        assert updated_input['ta'] == updated_input['tr']
 
 
 def test_pmv_parameter():
@@ -216,12 +223,10 @@ def test_discomfort_reason_check():
     assert condition_test == 0
 
 
-def test_init_pmv_collection():
+def test_init_pmv_collection(pmv_default):
     """Test the initialization of the PMV collection and basic outputs."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
-    pmv_obj = PMV(air_temp, 50)
+    pmv_obj = pmv_default
 
     assert pmv_obj.comfort_model == 'Predicted Mean Vote'
     assert pmv_obj.calc_length == calc_length
@@ -251,12 +256,10 @@ def test_init_pmv_collection():
         (pmv_obj.air_temperature[0] + pmv_obj.rad_temperature[0]) / 2, rel=1e-3)
 
 
-def test_pmv_collection_defaults():
+def test_pmv_collection_defaults(pmv_default):
     """Test the default inputs assigned to the PMV collection."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
-    pmv_obj = PMV(air_temp, 50)
+    pmv_obj = pmv_default
 
     assert isinstance(pmv_obj.rad_temperature, HourlyContinuousCollection)
     assert len(pmv_obj.rad_temperature.values) == calc_length
@@ -286,11 +289,10 @@ def test_pmv_collection_defaults():
     assert pmv_obj.comfort_parameter.still_air_threshold == default_par.still_air_threshold
 
 
-def test_pmv_collection_comfort_outputs():
+def test_pmv_collection_comfort_outputs(day_header):
     """Test the is_comfortable and thermal_condition outputs of the PMV collection."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, range(20, 20 + calc_length))
+    air_temp = HourlyContinuousCollection(day_header, range(20, 20 + calc_length))
     pmv_obj = PMV(air_temp, 50)
 
     assert isinstance(pmv_obj.is_comfortable, HourlyContinuousCollection)
@@ -312,11 +314,9 @@ def test_pmv_collection_comfort_outputs():
     assert pmv_obj.discomfort_reason[10] == 1
 
 
-def test_pmv_collection_heat_loss_outputs():
+def test_pmv_collection_heat_loss_outputs(air_temp):
     """Test the heat loss outputs of the PMV collection."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
     pmv_obj = PMV(air_temp, 50, air_speed=0.5)
 
     assert isinstance(pmv_obj.adjusted_air_temperature, HourlyContinuousCollection)
@@ -352,11 +352,9 @@ def test_pmv_collection_heat_loss_outputs():
     assert pmv_obj.heat_loss_convection[0] == pytest.approx(26.296, rel=1e-2)
 
 
-def test_pmv_collection_humidity_ratio_outputs():
+def test_pmv_collection_humidity_ratio_outputs(air_temp):
     """Test the humudity ratio outputs of the PMV collection."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
     pmv_obj = PMV(air_temp, 90)
 
     assert isinstance(pmv_obj.humidity_ratio, HourlyContinuousCollection)
@@ -374,11 +372,9 @@ def test_pmv_collection_humidity_ratio_outputs():
     assert pmv_obj.discomfort_reason[0] == 2
 
 
-def test_pmv_collection_immutability():
+def test_pmv_collection_immutability(air_temp):
     """Test that the PMV collection is immutable."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
     pmv_obj = PMV(air_temp, 50)
 
     # check that editing the original collection does not mutate the object
@@ -386,31 +382,23 @@ def test_pmv_collection_immutability():
     assert pmv_obj.air_temperature[0] == 24
 
     # check that editing collection properties does not mutate the object
-    with pytest.raises(Exception):
-        pmv_obj.air_temperature[0] = 26
-    with pytest.raises(Exception):
-        pmv_obj.air_temperature.values = [26] * calc_length
-    with pytest.raises(Exception):
-        pmv_obj.predicted_mean_vote[0] = 0.5
-    with pytest.raises(Exception):
-        pmv_obj.predicted_mean_vote.values = [0.5] * calc_length
+    for coll, val in ((pmv_obj.air_temperature, 26), (pmv_obj.predicted_mean_vote, 0.5)):
+        with pytest.raises(Exception):
+            coll[0] = val
+        with pytest.raises(Exception):
+            coll.values = [val] * calc_length
     pmv_obj.comfort_parameter.ppd_comfort_thresh = 15
     assert pmv_obj.comfort_parameter.ppd_comfort_thresh == 10
 
     # check that properties cannot be edited directly
-    with pytest.raises(Exception):
-        pmv_obj.air_temperature = air_temp
-    with pytest.raises(Exception):
-        pmv_obj.predicted_mean_vote = air_temp
-    with pytest.raises(Exception):
-        pmv_obj.comfort_parameter = PMVParameter()
+    for attr, val in (('air_temperature', air_temp), ('predicted_mean_vote', air_temp),
+                      ('comfort_parameter', PMVParameter())):
+        with pytest.raises(Exception):
+            setattr(pmv_obj, attr, val)
 
 
-def test_init_pmv_collection_full_input():
+def test_init_pmv_collection_full_input(air_temp):
     """Test the initialization of the PMV collection will all inputs."""
-    calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
     custom_par = PMVParameter(15, 0.012, 0.004, 0.2)
     pmv_obj = PMV(air_temp, 50, 22, 0.5, 1.2, 0.85, 0.1, custom_par)
 
@@ -427,11 +415,9 @@ def test_init_pmv_collection_full_input():
     assert pmv_obj.comfort_parameter.still_air_threshold == 0.2
 
 
-def test_init_pmv_collection_full_collection_input():
+def test_init_pmv_collection_full_collection_input(air_temp):
     """Test initialization of the PMV collection will all inputs as collections."""
     calc_length = 24
-    air_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
-    air_temp = HourlyContinuousCollection(air_temp_header, [24] * calc_length)
     rel_humid_header = Header(RelativeHumidity(), '%', AnalysisPeriod(end_month=1, end_day=1))
     rel_humid = HourlyContinuousCollection(rel_humid_header, [50] * calc_length)
     rad_temp_header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -456,12 +442,11 @@ def test_init_pmv_collection_full_collection_input():
     assert pmv_obj.external_work[0] == 0.1
 
 
-def test_init_pmv_collection_epw():
+@pytest.mark.slow
+def test_init_pmv_collection_epw(chicago_epw):
     """Test the initialization of the PMV collection with EPW input."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
-    pmv_obj = PMV(epw.dry_bulb_temperature, epw.relative_humidity)
+    pmv_obj = PMV(chicago_epw.dry_bulb_temperature, chicago_epw.relative_humidity)
 
     assert len(pmv_obj.air_temperature.values) == calc_length
     assert pmv_obj.air_temperature[0] == -6.1
@@ -476,11 +461,9 @@ def test_init_pmv_collection_epw():
     assert pmv_obj.standard_effective_temperature[0] == pytest.approx(-3.65, rel=1e-2)
 
 
-def test_pmv_collection_comfort_percent_outputs():
+def test_pmv_collection_comfort_percent_outputs(chicago_epw):
     """Test the percent outputs of the PMV collection."""
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
-    pmv_obj = PMV(epw.dry_bulb_temperature, epw.relative_humidity,
+    pmv_obj = PMV(chicago_epw.dry_bulb_temperature, chicago_epw.relative_humidity,
                   met_rate=2.4, clo_value=1)
 
     assert pmv_obj.percent_comfortable == pytest.approx(18.961187, rel=1e-3)
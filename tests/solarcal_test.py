@@ -15,16 +15,24 @@ from ladybug.location import Location
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.epw import EPW
-from ladybug.wea import Wea
 from ladybug.sunpath import Sunpath
 
 from ladybug.datatype.energyflux import Irradiance
 
 import math
-import sys
-if (sys.version_info > (3, 0)):
-    xrange = range
+
+
+@pytest.fixture(scope='module')
+def irr_header_day():
+    """Irradiance header for a single day that is shared by the collection tests."""
+    return Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
+
+
+@pytest.fixture(scope='module')
+def day_solar(irr_header_day):
+    """Direct normal and diffuse horizontal collections of 500 and 200 W/m2 for a day."""
+    return HourlyContinuousCollection(irr_header_day, [500] * 24), \
+        HourlyContinuousCollection(irr_header_day, [200] * 24)
 
 
 def test_outdoor_sky_heat_exch():
@@ -96,12 +104,9 @@ def test_solarcal_validation():
         csv_data_file.readline()
         csv_data_file.readline()
         for row in csv_data_file:
-            vals = []
-            for val in row.split(','):
-                try:
-                    vals.append(float(val))
-                except ValueError:
-                    vals.append(str(val))
+            # every column is a number except for the posture in the third column
+            vals = [val if i == 2 else float(val)
+                    for i, val in enumerate(row.split(','))]
             i_diff = 0.17 * vals[3] * math.sin(math.radians(vals[0]))
             result = indoor_sky_heat_exch(20, i_diff, vals[3], vals[0], vals[5],
                                           vals[6], 0.6, vals[4], vals[2],
@@ -111,21 +116,24 @@ def test_solarcal_validation():
             assert result['dmrt'] == pytest.approx(vals[9], rel=1e-1)
 
 
-def test_body_dir_from_dir_normal():
+def test_body_dir_from_dir_normal(chicago_wea):
     """Test body_solar_flux_from_parts gainst its horizontal counterpart."""
-    wea_obj = Wea.from_epw_file('./tests/epw/chicago.epw')
+    wea_obj = chicago_wea
     diff_hr = wea_obj.diffuse_horizontal_irradiance.values
     dir_nr = wea_obj.direct_normal_irradiance.values
-    dir_hr = wea_obj.direct_horizontal_irradiance.values
     dts = wea_obj.datetimes
     sp = Sunpath.from_location(wea_obj.location)
 
-    for i in xrange(8760):
-        sun = sp.calculate_sun_from_date_time(dts[i])
+    # direct horizontal irradiance is derived from the same sun that is used below
+    # instead of recomputing all sun positions through
+    # wea_obj.direct_horizontal_irradiance
+    for dt, diff, d_nr in zip(dts, diff_hr, dir_nr):
+        sun = sp.calculate_sun_from_date_time(dt)
         alt, az = sun.altitude, sun.azimuth
+        d_hr = d_nr * math.sin(math.radians(alt))
         sharp = sharp_from_solar_and_body_azimuth(az, 180)
-        sflux1 = body_solar_flux_from_parts(diff_hr[i], dir_nr[i], alt, sharp)
-        sflux2 = body_solar_flux_from_horiz_solar(diff_hr[i], dir_hr[i], alt, sharp)
+        sflux1 = body_solar_flux_from_parts(diff, d_nr, alt, sharp)
+        sflux2 = body_solar_flux_from_horiz_solar(diff, d_hr, alt, sharp)
         assert sflux1 == pytest.approx(sflux2, rel=1e-2)
 
 
@@ -165,8 +173,8 @@ def test_sharp_from_solar_and_body_azimuth():
 def test_projection_factors():
     """Test the projection factor functions against one another."""
     for posture in ('standing', 'seated', 'supine'):
-        for alt in list(xrange(1, 90, 10)) + [90]:
-            for sharp in xrange(0, 190, 10):
+        for alt in list(range(1, 90, 10)) + [90]:
+            for sharp in range(0, 190, 10):
                 pf1 = get_projection_factor(alt, sharp, posture)
                 pf2 = get_projection_factor_simple(alt, sharp, posture)
                 assert pf1 == pytest.approx(pf2, rel=0.1)
@@ -272,12 +280,10 @@ def test_solarcal_parameter_to_from_str():
     assert new_solarcal_par.body_emissivity == emissivity
 
 
-def test_init_outdoor_solarcal_collection():
+def test_init_outdoor_solarcal_collection(day_solar):
     """Test the initialization of the OutdoorSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     solarcal_obj = OutdoorSolarCal(Location(), dir_norm, diff_horiz, 350, 24)
 
     assert solarcal_obj.comfort_model == 'Outdoor SolarCal'
@@ -311,12 +317,10 @@ def test_init_outdoor_solarcal_collection():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(48.88688, rel=1e-3)
 
 
-def test_outdoor_solarcal_collection_defaults():
+def test_outdoor_solarcal_collection_defaults(day_solar):
     """Test the default inputs assigned to the OutdoorSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     solarcal_obj = OutdoorSolarCal(Location(), dir_norm, diff_horiz, 350, 24)
 
     assert isinstance(solarcal_obj.fraction_body_exposed, HourlyContinuousCollection)
@@ -340,12 +344,9 @@ def test_outdoor_solarcal_collection_defaults():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == default_par.body_emissivity
 
 
-def test_outdoor_solarcal_collection_full_input():
+def test_outdoor_solarcal_collection_full_input(day_solar):
     """Test the initialization of the OutdoorSolarCal collection will all inputs."""
-    calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     custom_par = SolarCalParameter('seated', None, 45, 0.65, 0.97)
     solarcal_obj = OutdoorSolarCal(Location(), dir_norm, diff_horiz, 350, 24,
                                    0.6, 0.4, 0.35, custom_par)
@@ -360,11 +361,10 @@ def test_outdoor_solarcal_collection_full_input():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == 0.97
 
 
-def test_init_outdoor_solarcal_collection_epw():
+def test_init_outdoor_solarcal_collection_epw(chicago_epw):
     """Test the initialization of the OutdoorSolarCal collection with EPW input."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
     solarcal_obj = OutdoorSolarCal(epw.location, epw.direct_normal_radiation,
                                    epw.diffuse_horizontal_radiation,
                                    epw.horizontal_infrared_radiation_intensity,
@@ -397,12 +397,10 @@ def test_init_outdoor_solarcal_collection_epw():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(9.524518, rel=1e-3)
 
 
-def test_init_indoor_solarcal_collection():
+def test_init_indoor_solarcal_collection(day_solar):
     """Test the initialization of the IndoorSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     solarcal_obj = IndoorSolarCal(Location(), dir_norm, diff_horiz, 24)
 
     assert solarcal_obj.comfort_model == 'Indoor SolarCal'
@@ -427,12 +425,10 @@ def test_init_indoor_solarcal_collection():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(36.600738, rel=1e-3)
 
 
-def test_indoor_solarcal_collection_defaults():
+def test_indoor_solarcal_collection_defaults(day_solar):
     """Test the default inputs assigned to the IndoorSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     solarcal_obj = IndoorSolarCal(Location(), dir_norm, diff_horiz, 24)
 
     assert isinstance(solarcal_obj.fraction_body_exposed, HourlyContinuousCollection)
@@ -460,12 +456,9 @@ def test_indoor_solarcal_collection_defaults():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == default_par.body_emissivity
 
 
-def test_indoor_solarcal_collection_full_input():
+def test_indoor_solarcal_collection_full_input(day_solar):
     """Test the initialization of the IndoorSolarCal collection will all inputs."""
-    calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     custom_par = SolarCalParameter('seated', None, 45, 0.65, 0.97)
     solarcal_obj = IndoorSolarCal(Location(), dir_norm, diff_horiz, 24,
                                   0.6, 0.4, 0.35, 0.7, custom_par)
@@ -481,11 +474,10 @@ def test_indoor_solarcal_collection_full_input():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == 0.97
 
 
-def test_init_indoor_solarcal_collection_epw():
+def test_init_indoor_solarcal_collection_epw(chicago_epw):
     """Test the initialization of the IndoorSolarCal collection with EPW input."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
     solarcal_obj = IndoorSolarCal(epw.location, epw.direct_normal_radiation,
                                   epw.diffuse_horizontal_radiation, 24)
 
@@ -507,12 +499,11 @@ def test_init_indoor_solarcal_collection_epw():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(31.6436828, rel=1e-3)
 
 
-def test_init_horizontal_solarcal_collection():
+def test_init_horizontal_solarcal_collection(irr_header_day):
     """Test the initialization of the HorizontalSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [300] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [100] * calc_length)
+    dir_norm = HourlyContinuousCollection(irr_header_day, [300] * calc_length)
+    diff_horiz = HourlyContinuousCollection(irr_header_day, [100] * calc_length)
     solarcal_obj = HorizontalSolarCal(Location(), dir_norm, diff_horiz, 24)
 
     assert solarcal_obj.comfort_model == 'Horizontal SolarCal'
@@ -537,12 +528,10 @@ def test_init_horizontal_solarcal_collection():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(42.20503, rel=1e-3)
 
 
-def test_horizontal_solarcal_collection_defaults():
+def test_horizontal_solarcal_collection_defaults(day_solar):
     """Test the default inputs assigned to the HorizontalSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     solarcal_obj = HorizontalSolarCal(Location(), dir_norm, diff_horiz, 24)
 
     assert isinstance(solarcal_obj.fraction_body_exposed, HourlyContinuousCollection)
@@ -562,12 +551,9 @@ def test_horizontal_solarcal_collection_defaults():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == default_par.body_emissivity
 
 
-def test_horizontal_solarcal_collection_full_input():
+def test_horizontal_solarcal_collection_full_input(day_solar):
     """Test the initialization of the HorizontalSolarCal collection will all inputs."""
-    calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [500] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [200] * calc_length)
+    dir_norm, diff_horiz = day_solar
     custom_par = SolarCalParameter('seated', None, 45, 0.65, 0.97)
     solarcal_obj = HorizontalSolarCal(Location(), dir_norm, diff_horiz, 24,
                                       0.6, 0.35, custom_par)
@@ -581,10 +567,10 @@ def test_horizontal_solarcal_collection_full_input():
     assert solarcal_obj.solarcal_body_parameter.body_emissivity == 0.97
 
 
-def test_init_horizontal_solarcal_collection_epw():
+def test_init_horizontal_solarcal_collection_epw(chicago_wea):
     """Test the initialization of the HorizontalSolarCal collection with EPW input."""
     calc_length = 8760
-    wea_obj = Wea.from_epw_file('./tests/epw/chicago.epw')
+    wea_obj = chicago_wea
     diff_hr = wea_obj.diffuse_horizontal_irradiance
     dir_hr = wea_obj.direct_horizontal_irradiance
     solarcal_obj = HorizontalSolarCal(wea_obj.location, dir_hr, diff_hr, 24)
@@ -607,13 +593,12 @@ def test_init_horizontal_solarcal_collection_epw():
     assert solarcal_obj.mean_radiant_temperature[12] == pytest.approx(42.997806, rel=1e-3)
 
 
-def test_init_horizontal_ref_solarcal_collection():
+def test_init_horizontal_ref_solarcal_collection(irr_header_day):
     """Test the initialization of the HorizontalRefSolarCal collection."""
     calc_length = 24
-    irr_header = Header(Irradiance(), 'W/m2', AnalysisPeriod(end_month=1, end_day=1))
-    dir_norm = HourlyContinuousCollection(irr_header, [300] * calc_length)
-    diff_horiz = HourlyContinuousCollection(irr_header, [100] * calc_length)
-    ref_horiz = HourlyContinuousCollection(irr_header, [100] * calc_length)
+    dir_norm = HourlyContinuousCollection(irr_header_day, [300] * calc_length)
+    diff_horiz = HourlyContinuousCollection(irr_header_day, [100] * calc_length)
+    ref_horiz = HourlyContinuousCollection(irr_header_day, [100] * calc_length)
     solarcal_obj = HorizontalRefSolarCal(Location(), dir_norm, diff_horiz, ref_horiz, 24)
 
     assert solarcal_obj.comfort_model == 'Horizontal Reflected SolarCal'
@@ -9,7 +9,6 @@ from ladybug_comfort.utci import universal_thermal_climate_index, calc_missing_u
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.header import Header
 from ladybug.datacollection import HourlyContinuousCollection
-from ladybug.epw import EPW
 
 from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.fraction import RelativeHumidity
@@ -455,11 +454,10 @@ def test_init_utci_collection_full_collection_input():
     assert utci_obj.wind_speed[0] == 0.5
 
 
-def test_init_utci_collection_epw():
+def test_init_utci_collection_epw(chicago_epw):
     """Test the initialization of the UTCI collection with EPW input."""
     calc_length = 8760
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
     utci_obj = UTCI(epw.dry_bulb_temperature, epw.relative_humidity)
 
     assert len(utci_obj.air_temperature.values) == calc_length
@@ -473,10 +471,9 @@ def test_init_utci_collection_epw():
     assert utci_obj.thermal_condition_eleven_point[0] == -2
 
 
-def test_utci_collection_comfort_percent_outputs():
+def test_utci_collection_comfort_percent_outputs(chicago_epw):
     """Test the is_comfortable and percent outputs of the UTCI collection."""
-    relative_path = './tests/epw/chicago.epw'
-    epw = EPW(relative_path)
+    epw = chicago_epw
     utci_obj = UTCI(epw.dry_bulb_temperature, epw.relative_humidity, wind_speed=epw.wind_speed)
 
     assert utci_obj.percent_comfortable == pytest.approx(35.6849315, rel=1e-3)